@@ -11,12 +11,13 @@ from .models import (
 )
 from .config import (
     ConfigError,
+    clear_config_cache,
     load_state_machine_config,
     parse_state_machine_config,
     schemas_backend_available,
     schemas_contract_available,
 )
-from .evaluator import Evaluator, evaluate_gates
+from .evaluator import Evaluator, evaluate_gates, evaluate_gates_batch
 from .schemas import schemas_available
 from .applier import apply_decisions
 from .explain import format_decision_trace
@@ -38,9 +39,11 @@ __all__ = [
     "SoftThreshold",
     "Evaluator",
     "evaluate_gates",
+    "evaluate_gates_batch",
     "apply_decisions",
     "parse_state_machine_config",
     "load_state_machine_config",
+    "clear_config_cache",
     "schemas_backend_available",
     "schemas_contract_available",
     "schemas_available",
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import Any, Iterator, Mapping
+
+_MISSING = object()
+
+
+class CopyOnWriteDict(MutableMapping):
+    """Mutable view over a read-only mapping that only copies what it touches.
+
+    Writes land in an override layer, so the base mapping is never mutated.
+    ``setdefault`` hands out a private shallow copy of list/dict values the
+    first time they are requested, which lets callers append or assign into
+    them in place without affecting the base.
+    """
+
+    __slots__ = ("_base", "_overrides", "_deleted")
+
+    def __init__(self, base: Mapping[str, Any]) -> None:
+        self._base = base
+        self._overrides: dict[str, Any] = {}
+        self._deleted: set[str] = set()
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._overrides.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if key in self._deleted:
+            raise KeyError(key)
+        return self._base[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._deleted.discard(key)
+        self._overrides[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._overrides:
+            del self._overrides[key]
+            if key in self._base:
+                self._deleted.add(key)
+            return
+        if key in self._deleted or key not in self._base:
+            raise KeyError(key)
+        self._deleted.add(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._base:
+            if key not in self._deleted:
+                yield key
+        for key in self._overrides:
+            if key not in self._base:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._overrides:
+            return True
+        return key not in self._deleted and key in self._base
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        value = self._overrides.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if key not in self._deleted and key in self._base:
+            value = self._base[key]
+            if isinstance(value, list):
+                value = list(value)
+            elif isinstance(value, dict):
+                value = dict(value)
+            else:
+                return value
+        else:
+            value = default
+        self[key] = value
+        return value
+
+    def materialize(self) -> dict[str, Any]:
+        return {key: self[key] for key in self}
@@ -0,0 +1,120 @@
+"""Optional msgspec fast path for JSON configs in ``load_state_machine_config``.
+
+Accepts a strict subset of what ``parse_state_machine_config`` accepts and
+returns ``None`` for anything else, so the mapping parser remains the single
+source of validation errors.
+"""
+
+from __future__ import annotations
+
+from typing import Annotated, Any, Literal
+
+import msgspec
+
+from .config import _build_state_machine_config, _intern
+from .models import GateConfig, HardRequirement, SoftThreshold, StateMachineConfig
+
+_NonEmptyStr = Annotated[str, msgspec.Meta(min_length=1)]
+_NonNegativeInt = Annotated[int, msgspec.Meta(ge=0)]
+
+
+class _HardRequirementSchema(msgspec.Struct):
+    requirement_id: _NonEmptyStr
+    field: _NonEmptyStr
+    op: _NonEmptyStr
+    value: Any = None
+    source: Any = "features"
+
+
+class _SoftThresholdSchema(msgspec.Struct):
+    threshold_id: _NonEmptyStr
+    field: _NonEmptyStr
+    op: _NonEmptyStr
+    value: Any
+    source: Any = "features"
+
+
+class _GateSchema(msgspec.Struct):
+    gate_id: _NonEmptyStr
+    version: _NonEmptyStr
+    from_state: _NonEmptyStr = msgspec.field(name="from")
+    to_state: _NonEmptyStr = msgspec.field(name="to")
+    track: Any = None
+    hard_requirements: list[_HardRequirementSchema] | None = None
+    soft_thresholds: list[_SoftThresholdSchema] | None = None
+    min_soft_passed: _NonNegativeInt | None = None
+    cooldown_seconds: _NonNegativeInt = 0
+    cooldown_on: Literal["pass", "attempt"] = "pass"
+    cooldown_scope: Literal["entity", "channel", "playbook", "channel_playbook"] = "entity"
+    cooldown_channel_field: str = "context.channel"
+    cooldown_playbook_field: str = "context.playbook"
+    suppression_field: Any = None
+    enqueue_tasks_on_pass: list[_NonEmptyStr] | None = None
+    failure_taxonomy: dict[str, str] | None = None
+
+
+class _StateMachineSchema(msgspec.Struct):
+    config_version: _NonEmptyStr
+    gates: Annotated[list[_GateSchema], msgspec.Meta(min_length=1)]
+
+
+_DECODER = msgspec.json.Decoder(_StateMachineSchema)
+
+
+def _to_gate_config(gate: _GateSchema) -> GateConfig:
+    return GateConfig(
+        gate_id=_intern(gate.gate_id),
+        version=_intern(gate.version),
+        track=_intern(gate.track),
+        from_state=_intern(gate.from_state),
+        to_state=_intern(gate.to_state),
+        hard_requirements=tuple(
+            HardRequirement(
+                requirement_id=_intern(item.requirement_id),
+                field=_intern(item.field),
+                op=_intern(item.op),
+                value=item.value,
+                source=_intern(item.source),
+            )
+            for item in gate.hard_requirements or ()
+        ),
+        soft_thresholds=tuple(
+            SoftThreshold(
+                threshold_id=_intern(item.threshold_id),
+                field=_intern(item.field),
+                op=_intern(item.op),
+                value=item.value,
+                source=_intern(item.source),
+            )
+            for item in gate.soft_thresholds or ()
+        ),
+        min_soft_passed=gate.min_soft_passed,
+        cooldown_seconds=gate.cooldown_seconds,
+        cooldown_on=_intern(gate.cooldown_on),
+        cooldown_scope=_intern(gate.cooldown_scope),
+        cooldown_channel_field=gate.cooldown_channel_field,
+        cooldown_playbook_field=gate.cooldown_playbook_field,
+        suppression_field=gate.suppression_field,
+        enqueue_tasks_on_pass=tuple(_intern(task) for task in gate.enqueue_tasks_on_pass or ()),
+        failure_taxonomy={_intern(k): _intern(v) for k, v in (gate.failure_taxonomy or {}).items()},
+    )
+
+
+def decode_state_machine_config(raw: bytes) -> StateMachineConfig | None:
+    try:
+        schema = _DECODER.decode(raw)
+    except msgspec.DecodeError:
+        return None
+
+    gates: list[GateConfig] = []
+    gate_ids: set[str] = set()
+    for gate in schema.gates:
+        if gate.gate_id in gate_ids:
+            return None
+        gate_ids.add(gate.gate_id)
+        parsed = _to_gate_config(gate)
+        if parsed.min_soft_passed is not None and parsed.min_soft_passed > len(parsed.soft_thresholds):
+            return None
+        gates.append(parsed)
+
+    return _build_state_machine_config(_intern(schema.config_version), gates)
@@ -0,0 +1,28 @@
+"""Optional numba kernel for outcome-window lookup in ``evaluate_attempt_outcomes``."""
+
+from __future__ import annotations
+
+import numba
+import numpy as np
+
+
+@numba.njit(cache=True)
+def window_bounds(outcome_us, start_us, end_us):  # type: ignore[no-untyped-def]
+    # Two-pointer sweep over attempts in start order. Windows share one length,
+    # so ends are ordered with starts and both pointers only move forward.
+    count = start_us.shape[0]
+    total = outcome_us.shape[0]
+    lows = np.empty(count, dtype=np.int64)
+    highs = np.empty(count, dtype=np.int64)
+    lo = 0
+    hi = 0
+    for i in np.argsort(start_us, kind="mergesort"):
+        while lo < total and outcome_us[lo] < start_us[i]:
+            lo += 1
+        if hi < lo:
+            hi = lo
+        while hi < total and outcome_us[hi] <= end_us[i]:
+            hi += 1
+        lows[i] = lo
+        highs[i] = hi
+    return lows, highs
@@ -2,11 +2,71 @@ from __future__ import annotations
 
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Iterable, Mapping
+from typing import Any, Iterable, Literal, Mapping
 
-from .models import GateDecision, TransitionApplied
+from ._cow import CopyOnWriteDict
+from .models import GateDecision
 from .schemas import build_task_and_emission, schemas_available
 
+_IMMUTABLE_LEAVES = (str, int, float, bool, type(None))
+_MISSING = object()
+
+
+def _fast_deepcopy(obj: Any, memo: dict[int, Any] | None = None) -> Any:
+    # State and snapshot payloads are JSON-shaped, so the common containers are
+    # copied directly instead of going through copy.deepcopy's dispatch path.
+    # The id() memo follows deepcopy's convention (and is handed to it for other
+    # types), so shared sub-objects stay shared and self-references resolve.
+    cls = type(obj)
+    if cls in _IMMUTABLE_LEAVES:
+        return obj
+    if memo is None:
+        memo = {}
+    copied = memo.get(id(obj), _MISSING)
+    if copied is not _MISSING:
+        return copied
+    if cls is dict:
+        out_dict: dict[Any, Any] = {}
+        memo[id(obj)] = out_dict
+        for k, v in obj.items():
+            out_dict[k] = _fast_deepcopy(v, memo)
+        return out_dict
+    if cls is list:
+        out_list: list[Any] = []
+        memo[id(obj)] = out_list
+        for v in obj:
+            out_list.append(_fast_deepcopy(v, memo))
+        return out_list
+    if cls is tuple:
+        items = tuple(_fast_deepcopy(v, memo) for v in obj)
+        # A cycle through this tuple may already have produced its copy.
+        copied = memo.get(id(obj), _MISSING)
+        if copied is not _MISSING:
+            return copied
+        memo[id(obj)] = items
+        return items
+    return deepcopy(obj, memo)
+
+
+SnapshotPolicy = Literal["deepcopy", "shallow", "share"]
+_SNAPSHOT_POLICIES = frozenset(("deepcopy", "shallow", "share"))
+
+
+def _copy_snapshot(snapshot: Mapping[str, Any], policy: SnapshotPolicy) -> Mapping[str, Any]:
+    if policy == "deepcopy":
+        return _fast_deepcopy(dict(snapshot))
+    if policy == "shallow":
+        return dict(snapshot)
+    return snapshot
+
+
+_BOOKKEEPING_FIELDS: tuple[tuple[str, type, str], ...] = (
+    ("gate_attempts", list, "entity_state.gate_attempts must be a list when present"),
+    ("transitions_applied", list, "entity_state.transitions_applied must be a list when present"),
+    ("gate_cooldowns", dict, "entity_state.gate_cooldowns must be an object when present"),
+    ("gate_cooldowns_scoped", dict, "entity_state.gate_cooldowns_scoped must be an object when present"),
+)
+
 
 def apply_decisions(
     entity_state: Mapping[str, Any],
@@ -14,8 +74,43 @@ def apply_decisions(
     caused_by: str | None = None,
     use_schema_envelopes: bool = False,
     default_task_priority: int = 50,
+    snapshot_policy: SnapshotPolicy = "deepcopy",
 ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
-    new_state: dict[str, Any] = deepcopy(dict(entity_state))
+    """Applies gate decisions to an entity state and returns (new_state, emissions).
+
+    ``snapshot_policy`` controls how decision snapshots are stored on the
+    attempt/applied records: ``"deepcopy"`` (default) gives each record an
+    independent copy, ``"shallow"`` copies only the top-level mapping, and
+    ``"share"`` stores the decision's snapshot object itself. Use the cheaper
+    tiers only when records are treated as read-only.
+
+    ``entity_state`` itself is never mutated, but the returned state is not a
+    deep copy of it: the bookkeeping containers (``gate_attempts``,
+    ``transitions_applied``, ``gate_cooldowns``, ``gate_cooldowns_scoped``) are
+    new top-level containers, while every other nested value, and the records
+    already in those containers, is shared with ``entity_state``. Copy the
+    result (for example with ``copy.deepcopy``) before mutating nested values
+    in place if the caller's mapping must stay unchanged.
+    """
+
+    if snapshot_policy not in _SNAPSHOT_POLICIES:
+        raise ValueError("snapshot_policy must be one of: deepcopy, shallow, share")
+
+    # Validate the bookkeeping containers on the caller's mapping before any copying.
+    for key, expected, message in _BOOKKEEPING_FIELDS:
+        if key in entity_state and not isinstance(entity_state[key], expected):
+            raise ValueError(message)
+
+    decisions = list(decisions)
+    if not decisions:
+        unchanged = dict(entity_state)
+        for key, expected, _ in _BOOKKEEPING_FIELDS:
+            unchanged[key] = expected(unchanged.get(key, ()))
+        return unchanged, []
+
+    # Only the bookkeeping containers below are copied; untouched entity fields
+    # are shared with the caller's mapping, which is never mutated.
+    new_state = CopyOnWriteDict(entity_state)
     emissions: list[dict[str, Any]] = []
 
     attempts = new_state.setdefault("gate_attempts", [])
@@ -23,18 +118,23 @@ def apply_decisions(
     cooldowns = new_state.setdefault("gate_cooldowns", {})
     scoped_cooldowns = new_state.setdefault("gate_cooldowns_scoped", {})
 
-    if not isinstance(attempts, list):
-        raise ValueError("entity_state.gate_attempts must be a list when present")
-    if not isinstance(applied, list):
-        raise ValueError("entity_state.transitions_applied must be a list when present")
-    if not isinstance(cooldowns, dict):
-        raise ValueError("entity_state.gate_cooldowns must be an object when present")
-    if not isinstance(scoped_cooldowns, dict):
-        raise ValueError("entity_state.gate_cooldowns_scoped must be an object when present")
+    use_schemas = use_schema_envelopes and schemas_available()
 
+    # Records are accumulated locally and flushed into the state once at the end.
+    new_attempts: list[dict[str, Any]] = []
+    new_applied: list[dict[str, Any]] = []
+    cooldown_updates: dict[str, str] = {}
+    scoped_updates: dict[str, dict[str, str]] = {}
+
+    last_timestamp: datetime | None = None
+    ts_iso = ""
     for decision in decisions:
         attempted = decision.transition_attempted
-        attempts.append(
+        if attempted.timestamp is not last_timestamp:
+            last_timestamp = attempted.timestamp
+            ts_iso = attempted.timestamp.isoformat()
+        ts_epoch = int(attempted.timestamp.timestamp()) if use_schemas else None
+        new_attempts.append(
             {
                 "gate_id": attempted.gate_id,
                 "from": attempted.from_state,
@@ -42,95 +142,98 @@ def apply_decisions(
                 "passed": attempted.passed,
                 "reason": attempted.reason,
                 "failed_requirement_id": attempted.failed_requirement_id,
-                "timestamp": attempted.timestamp.isoformat(),
-                "snapshot": deepcopy(dict(attempted.snapshot)),
+                "timestamp": ts_iso,
+                "snapshot": _copy_snapshot(attempted.snapshot, snapshot_policy),
             }
         )
 
         if decision.passed:
             new_state["state"] = decision.to_state
 
-            record = TransitionApplied(
-                gate_id=decision.gate_id,
-                from_state=decision.from_state,
-                to_state=decision.to_state,
-                caused_by=caused_by,
-                timestamp=attempted.timestamp,
-                snapshot=deepcopy(dict(attempted.snapshot)),
-            )
-            applied.append(
+            new_applied.append(
                 {
-                    "gate_id": record.gate_id,
-                    "from": record.from_state,
-                    "to": record.to_state,
-                    "caused_by": record.caused_by,
-                    "timestamp": record.timestamp.isoformat(),
-                    "snapshot": record.snapshot,
+                    "gate_id": decision.gate_id,
+                    "from": decision.from_state,
+                    "to": decision.to_state,
+                    "caused_by": caused_by,
+                    "timestamp": ts_iso,
+                    "snapshot": _copy_snapshot(attempted.snapshot, snapshot_policy),
                 }
             )
 
-            for task in decision.enqueue_tasks_on_pass:
+            if decision.enqueue_tasks_on_pass:
                 feature_snapshot = attempted.snapshot.get("feature_snapshot")
                 context = feature_snapshot.get("context", {}) if isinstance(feature_snapshot, Mapping) else {}
                 scores = feature_snapshot.get("scores", {}) if isinstance(feature_snapshot, Mapping) else {}
                 token = feature_snapshot.get("token", {}) if isinstance(feature_snapshot, Mapping) else {}
+                entity_id = new_state.get("entity_id")
                 channel = context.get("channel")
                 playbook = context.get("playbook")
-                recommendation_score = scores.get("recommendation_score")
                 token_address = token.get("address")
                 chain = token.get("chain")
                 symbol = token.get("symbol")
-                base_emission: dict[str, Any] = {
+                # Decision-level fields are shared by every task; placeholders keep key order stable.
+                emission_template: dict[str, Any] = {
                     "kind": "task_enqueued",
-                    "task_id": task,
+                    "task_id": None,
                     "gate_id": decision.gate_id,
                     "gate_version": decision.gate_version,
-                    "entity_id": new_state.get("entity_id"),
+                    "entity_id": entity_id,
                     "from_state": decision.from_state,
                     "to_state": decision.to_state,
                     "channel": channel,
                     "playbook": playbook,
-                    "recommendation_score": recommendation_score,
+                    "recommendation_score": scores.get("recommendation_score"),
                     "token_address": token_address,
                     "chain": chain,
                     "symbol": symbol,
                     "caused_by": caused_by,
-                    "timestamp": attempted.timestamp.isoformat(),
-                    "worker_metadata": {
-                        "drafter": {"entity_id": new_state.get("entity_id"), "channel": channel, "playbook": playbook},
-                        "digest": {"entity_id": new_state.get("entity_id"), "channel": channel, "playbook": playbook},
+                    "timestamp": ts_iso,
+                    "worker_metadata": None,
+                }
+
+                for task in decision.enqueue_tasks_on_pass:
+                    base_emission = emission_template.copy()
+                    base_emission["task_id"] = task
+                    base_emission["worker_metadata"] = {
+                        "drafter": {"entity_id": entity_id, "channel": channel, "playbook": playbook},
+                        "digest": {"entity_id": entity_id, "channel": channel, "playbook": playbook},
                         "token": {
-                            "entity_id": new_state.get("entity_id"),
+                            "entity_id": entity_id,
                             "token_address": token_address,
                             "chain": chain,
                             "symbol": symbol,
                         },
-                    },
-                }
-                if use_schema_envelopes and schemas_available():
-                    entity_id = new_state.get("entity_id")
-                    if not isinstance(entity_id, str) or not entity_id:
-                        raise ValueError("entity_state.entity_id is required when use_schema_envelopes=True")
-                    schema_payload = build_task_and_emission(
-                        task_id=task,
-                        created_at=attempted.timestamp,
-                        caused_by=caused_by or "unknown",
-                        entity_id=entity_id,
-                        gate_id=decision.gate_id,
-                        emission_id=f"{decision.gate_id}:{task}:{int(attempted.timestamp.timestamp())}",
-                        priority=default_task_priority,
-                    )
-                    if schema_payload is not None:
-                        base_emission["schema"] = schema_payload
-                emissions.append(base_emission)
+                    }
+                    if use_schemas:
+                        if not isinstance(entity_id, str) or not entity_id:
+                            raise ValueError("entity_state.entity_id is required when use_schema_envelopes=True")
+                        schema_payload = build_task_and_emission(
+                            task_id=task,
+                            created_at=attempted.timestamp,
+                            caused_by=caused_by or "unknown",
+                            entity_id=entity_id,
+                            gate_id=decision.gate_id,
+                            emission_id=f"{decision.gate_id}:{task}:{ts_epoch}",
+                            priority=default_task_priority,
+                        )
+                        if schema_payload is not None:
+                            base_emission["schema"] = schema_payload
+                    emissions.append(base_emission)
 
         if decision.cooldown_on == "attempt" or (decision.cooldown_on == "pass" and decision.passed):
             if decision.cooldown_scope == "entity" or not decision.cooldown_scope_key:
-                cooldowns[decision.gate_id] = decision.transition_attempted.timestamp.isoformat()
+                cooldown_updates[decision.gate_id] = ts_iso
             else:
-                gate_scoped = scoped_cooldowns.setdefault(decision.gate_id, {})
-                if not isinstance(gate_scoped, dict):
-                    raise ValueError("entity_state.gate_cooldowns_scoped[gate_id] must be an object when present")
-                gate_scoped[decision.cooldown_scope_key] = decision.transition_attempted.timestamp.isoformat()
+                scoped_updates.setdefault(decision.gate_id, {})[decision.cooldown_scope_key] = ts_iso
+
+    attempts.extend(new_attempts)
+    applied.extend(new_applied)
+    cooldowns.update(cooldown_updates)
+    for gate_id, updates in scoped_updates.items():
+        gate_scoped = scoped_cooldowns.get(gate_id, {})
+        if not isinstance(gate_scoped, dict):
+            raise ValueError("entity_state.gate_cooldowns_scoped[gate_id] must be an object when present")
+        scoped_cooldowns[gate_id] = {**gate_scoped, **updates}
 
-    return new_state, emissions
+    return new_state.materialize(), emissions
@@ -1,12 +1,61 @@
 from __future__ import annotations
 
+import functools
 import importlib
+import inspect
 import json
+import re
+import sys
+import threading
 from pathlib import Path
 from typing import Any, Callable, Mapping
 
 from .models import GateConfig, HardRequirement, SoftThreshold, StateMachineConfig
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional speedup
+    msgspec = None  # type: ignore[assignment]
+
+# All decoders accept raw bytes. The untyped msgspec decoder is built once and
+# reused across loads; either fast decoder's errors route through _decode_json's
+# stdlib retry, so only content json.loads also rejects counts as non-JSON.
+_json_loads: Callable[[bytes], Any]
+_JSON_DECODE_ERRORS: tuple[type[Exception], ...]
+if orjson is not None:
+    _json_loads = orjson.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+elif msgspec is not None:
+    _json_loads = msgspec.json.Decoder().decode
+    _JSON_DECODE_ERRORS = (msgspec.DecodeError,)
+else:
+    _json_loads = json.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+# Any literal with 19 or more digits may fall outside int64/uint64 (for example
+# -9223372036854775809), which orjson widens to float; such payloads go to stdlib json.
+_WIDE_INT_LITERAL = re.compile(rb"\d{19}")
+
+
+def _decode_json(raw: bytes) -> Any:
+    # orjson and msgspec reject NaN/Infinity and orjson loses precision on wide
+    # integers, all of which stdlib json accepts; retry there before treating
+    # the content as non-JSON so results match json.loads exactly.
+    if _json_loads is not json.loads:
+        try:
+            parsed = _json_loads(raw)
+        except _JSON_DECODE_ERRORS:
+            pass
+        else:
+            if _WIDE_INT_LITERAL.search(raw) is None:
+                return parsed
+    return json.loads(raw.decode("utf-8"))
+
 
 class ConfigError(ValueError):
     pass
@@ -15,12 +64,22 @@ class ConfigError(ValueError):
 SCHEMAS_PARSE_HOOK = "parse_state_machine_config"
 SCHEMAS_VALIDATE_HOOK = "validate_state_machine_config"
 
+_COOLDOWN_ON_VALUES = frozenset(("pass", "attempt"))
+_COOLDOWN_SCOPE_VALUES = frozenset(("entity", "channel", "playbook", "channel_playbook"))
+_MAPPING_ATTRS = ("model_dump", "dict", "to_dict")
+
 
 def _mapping_from_object(value: Any) -> Mapping[str, Any] | None:
+    if type(value) is dict:
+        return value
+    return _coerce_mapping(value)
+
+
+def _coerce_mapping(value: Any) -> Mapping[str, Any] | None:
     if isinstance(value, Mapping):
         return value
 
-    for attr in ("model_dump", "dict", "to_dict"):
+    for attr in _MAPPING_ATTRS:
         fn = getattr(value, attr, None)
         if callable(fn):
             candidate = fn()
@@ -29,6 +88,7 @@ def _mapping_from_object(value: Any) -> Mapping[str, Any] | None:
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def _load_schemas_backend() -> Any | None:
     try:
         return importlib.import_module("metaspn_schemas")
@@ -49,13 +109,37 @@ def schemas_contract_available() -> bool:
     )
 
 
+@functools.lru_cache(maxsize=32)
+def _parser_arities(fn: Callable[..., Any]) -> tuple[int, ...]:
+    # Which of the supported call shapes, (payload) and (payload, path), the
+    # hook's own signature accepts, in that order. Derived from the hook alone,
+    # so earlier calls never change what is tried.
+    try:
+        signature = inspect.signature(fn)
+    except (TypeError, ValueError):  # pragma: no cover - uninspectable callables
+        return (1, 2)
+    arities: list[int] = []
+    for arity in (1, 2):
+        try:
+            signature.bind(*((None,) * arity))
+        except TypeError:
+            continue
+        arities.append(arity)
+    return tuple(arities)
+
+
 def _call_parser(fn: Callable[..., Any], payload: Mapping[str, Any], path: Path) -> Any | None:
-    last_exc: Exception | None = None
-    for args in ((payload,), (payload, str(path))):
+    try:
+        arities = _parser_arities(fn)
+    except TypeError:  # pragma: no cover - unhashable hook objects
+        arities = _parser_arities.__wrapped__(fn)
+
+    for arity in arities:
+        args = (payload,) if arity == 1 else (payload, str(path))
         try:
             return fn(*args)
-        except Exception as exc:  # pragma: no cover - backend-defined exception types
-            last_exc = exc
+        except Exception:  # pragma: no cover - backend-defined exception types
+            continue
     # Degrade gracefully to caller fallback path when parser hook isn't compatible
     # with gate config payload shape.
     return None
@@ -92,11 +176,39 @@ def _validate_with_schemas_backend(payload: Mapping[str, Any], backend: Any) ->
     return payload
 
 
+def _is_mapping(value: Any) -> bool:
+    # JSON-decoded configs are plain dicts; skip the ABC instance check for them.
+    return type(value) is dict or isinstance(value, Mapping)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_fast_decoder() -> Any | None:
+    try:
+        from . import _fastconfig
+    except ImportError:  # pragma: no cover - msgspec is an optional speedup
+        return None
+    return _fastconfig
+
+
+def _has_config_hooks(backend: Any | None) -> bool:
+    if backend is None:
+        return False
+    return callable(getattr(backend, SCHEMAS_PARSE_HOOK, None)) or callable(
+        getattr(backend, SCHEMAS_VALIDATE_HOOK, None)
+    )
+
+
+def _intern(value: Any) -> Any:
+    # Categorical config strings are compared and hashed on every evaluation;
+    # interning lets equal lookups short-circuit on identity.
+    return sys.intern(value) if type(value) is str else value
+
+
 def _require_str(mapping: Mapping[str, Any], key: str) -> str:
     value = mapping.get(key)
     if not isinstance(value, str) or not value:
         raise ConfigError(f"{key} must be a non-empty string")
-    return value
+    return _intern(value)
 
 
 def _parse_hard_requirements(raw: Any) -> tuple[HardRequirement, ...]:
@@ -107,7 +219,7 @@ def _parse_hard_requirements(raw: Any) -> tuple[HardRequirement, ...]:
 
     parsed: list[HardRequirement] = []
     for item in raw:
-        if not isinstance(item, Mapping):
+        if not _is_mapping(item):
             raise ConfigError("hard requirement entries must be objects")
         parsed.append(
             HardRequirement(
@@ -115,7 +227,7 @@ def _parse_hard_requirements(raw: Any) -> tuple[HardRequirement, ...]:
                 field=_require_str(item, "field"),
                 op=_require_str(item, "op"),
                 value=item.get("value"),
-                source=item.get("source", "features"),
+                source=_intern(item.get("source", "features")),
             )
         )
     return tuple(parsed)
@@ -129,7 +241,7 @@ def _parse_soft_thresholds(raw: Any) -> tuple[SoftThreshold, ...]:
 
     parsed: list[SoftThreshold] = []
     for item in raw:
-        if not isinstance(item, Mapping):
+        if not _is_mapping(item):
             raise ConfigError("soft threshold entries must be objects")
         if "value" not in item:
             raise ConfigError("soft threshold value is required")
@@ -139,7 +251,7 @@ def _parse_soft_thresholds(raw: Any) -> tuple[SoftThreshold, ...]:
                 field=_require_str(item, "field"),
                 op=_require_str(item, "op"),
                 value=item["value"],
-                source=item.get("source", "features"),
+                source=_intern(item.get("source", "features")),
             )
         )
     return tuple(parsed)
@@ -160,7 +272,7 @@ def parse_state_machine_config(payload: Mapping[str, Any]) -> StateMachineConfig
     gate_ids: set[str] = set()
 
     for gate in raw_gates:
-        if not isinstance(gate, Mapping):
+        if not _is_mapping(gate):
             raise ConfigError("gate entries must be objects")
 
         gate_id = _require_str(gate, "gate_id")
@@ -169,11 +281,11 @@ def parse_state_machine_config(payload: Mapping[str, Any]) -> StateMachineConfig
         gate_ids.add(gate_id)
 
         raw_tasks = gate.get("enqueue_tasks_on_pass") or []
-        if not isinstance(raw_tasks, list) or not all(isinstance(t, str) and t for t in raw_tasks):
+        if not isinstance(raw_tasks, list) or any(not (isinstance(t, str) and t) for t in raw_tasks):
             raise ConfigError("enqueue_tasks_on_pass must be a list of non-empty strings")
 
         raw_taxonomy = gate.get("failure_taxonomy") or {}
-        if not isinstance(raw_taxonomy, Mapping):
+        if not _is_mapping(raw_taxonomy):
             raise ConfigError("failure_taxonomy must be an object")
 
         cooldown_seconds = gate.get("cooldown_seconds", 0)
@@ -181,11 +293,11 @@ def parse_state_machine_config(payload: Mapping[str, Any]) -> StateMachineConfig
             raise ConfigError("cooldown_seconds must be a non-negative integer")
 
         cooldown_on = gate.get("cooldown_on", "pass")
-        if cooldown_on not in {"pass", "attempt"}:
+        if cooldown_on not in _COOLDOWN_ON_VALUES:
             raise ConfigError("cooldown_on must be either 'pass' or 'attempt'")
 
         cooldown_scope = gate.get("cooldown_scope", "entity")
-        if cooldown_scope not in {"entity", "channel", "playbook", "channel_playbook"}:
+        if cooldown_scope not in _COOLDOWN_SCOPE_VALUES:
             raise ConfigError("cooldown_scope must be one of: entity, channel, playbook, channel_playbook")
 
         min_soft_passed = gate.get("min_soft_passed")
@@ -195,20 +307,20 @@ def parse_state_machine_config(payload: Mapping[str, Any]) -> StateMachineConfig
         parsed = GateConfig(
             gate_id=gate_id,
             version=_require_str(gate, "version"),
-            track=gate.get("track"),
+            track=_intern(gate.get("track")),
             from_state=_require_str(gate, "from"),
             to_state=_require_str(gate, "to"),
             hard_requirements=_parse_hard_requirements(gate.get("hard_requirements")),
             soft_thresholds=_parse_soft_thresholds(gate.get("soft_thresholds")),
             min_soft_passed=min_soft_passed,
             cooldown_seconds=cooldown_seconds,
-            cooldown_on=cooldown_on,
-            cooldown_scope=cooldown_scope,
+            cooldown_on=_intern(cooldown_on),
+            cooldown_scope=_intern(cooldown_scope),
             cooldown_channel_field=str(gate.get("cooldown_channel_field", "context.channel")),
             cooldown_playbook_field=str(gate.get("cooldown_playbook_field", "context.playbook")),
             suppression_field=gate.get("suppression_field"),
-            enqueue_tasks_on_pass=tuple(raw_tasks),
-            failure_taxonomy={str(k): str(v) for k, v in raw_taxonomy.items()},
+            enqueue_tasks_on_pass=tuple(_intern(t) for t in raw_tasks),
+            failure_taxonomy={_intern(str(k)): _intern(str(v)) for k, v in raw_taxonomy.items()},
         )
 
         if parsed.min_soft_passed is not None and parsed.min_soft_passed > len(parsed.soft_thresholds):
@@ -216,26 +328,91 @@ def parse_state_machine_config(payload: Mapping[str, Any]) -> StateMachineConfig
 
         gates.append(parsed)
 
-    # Stable deterministic order.
-    gates.sort(key=lambda g: (g.track or "", g.from_state, g.gate_id))
+    return _build_state_machine_config(config_version, gates)
+
+
+def _build_state_machine_config(config_version: str, gates: list[GateConfig]) -> StateMachineConfig:
+    # Stable deterministic order. Configs are usually authored in this order
+    # already, so only reorder when the precomputed keys are out of sequence.
+    keys = [(g.track or "", g.from_state, g.gate_id) for g in gates]
+    if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+        order = sorted(range(len(gates)), key=keys.__getitem__)
+        gates = [gates[i] for i in order]
 
     return StateMachineConfig(config_version=config_version, gates=tuple(gates))
 
 
+# Parsed configs keyed by resolved path. Entries are only reused while the file
+# stamp and the schemas hooks that produced them are unchanged. Eviction is FIFO:
+# once _CONFIG_CACHE_MAX paths are held, the earliest-inserted path is dropped.
+# Writes go through _CONFIG_CACHE_LOCK so concurrent loads cannot evict twice.
+_CONFIG_CACHE: dict[str, tuple[tuple[Any, ...], StateMachineConfig]] = {}
+_CONFIG_CACHE_MAX = 64
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def clear_config_cache() -> None:
+    """Drops every config cached by ``load_state_machine_config``."""
+
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
+
+def _config_cache_stamp(path: Path, backend: Any | None) -> tuple[Any, ...]:
+    stat = path.stat()
+    return (
+        stat.st_mtime_ns,
+        stat.st_size,
+        backend,
+        getattr(backend, SCHEMAS_PARSE_HOOK, None),
+        getattr(backend, SCHEMAS_VALIDATE_HOOK, None),
+    )
+
+
 def load_state_machine_config(path: str | Path) -> StateMachineConfig:
-    """Loads config using metaspn_schemas contract hooks when available, otherwise JSON fallback."""
+    """Loads config using metaspn_schemas contract hooks when available, otherwise JSON fallback.
+
+    Results are cached per path (up to 64 paths, evicted FIFO) and reused until the
+    file's mtime or size changes, so callers share one config whose containers,
+    including list/dict requirement values, are read-only; ``clear_config_cache``
+    drops the cache.
+    """
 
     path = Path(path)
-    raw = path.read_text(encoding="utf-8")
+    backend = _load_schemas_backend()
+    cache_key = str(path.resolve())
+    stamp = _config_cache_stamp(path, backend)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    config = _read_state_machine_config(path, backend)
+    with _CONFIG_CACHE_LOCK:
+        if cache_key not in _CONFIG_CACHE:
+            while _CONFIG_CACHE and len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+                del _CONFIG_CACHE[next(iter(_CONFIG_CACHE))]
+        _CONFIG_CACHE[cache_key] = (stamp, config)
+    return config
+
+
+def _read_state_machine_config(path: Path, backend: Any | None) -> StateMachineConfig:
+    raw = path.read_bytes()
+
+    if not _has_config_hooks(backend):
+        fast_decoder = _load_fast_decoder()
+        if fast_decoder is not None:
+            config = fast_decoder.decode_state_machine_config(raw)
+            if config is not None:
+                return config
+
     decoded_payload: Mapping[str, Any] | None = None
     try:
-        parsed = json.loads(raw)
+        parsed = _decode_json(raw)
     except json.JSONDecodeError:
         parsed = None
     if parsed is not None:
         decoded_payload = _mapping_from_object(parsed)
 
-    backend = _load_schemas_backend()
     payload: Mapping[str, Any] | None = None
     if backend is not None:
         payload = _parse_with_schemas_backend(decoded_payload, path, backend)
@@ -1,57 +1,137 @@
 from __future__ import annotations
 
+import functools
+import operator
+import weakref
 from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Mapping
+from typing import Any, Callable, Mapping, Sequence
 
 from .models import GateDecision, GateConfig, StateMachineConfig, TransitionAttempted
 
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _split_path(path: str) -> tuple[str, ...]:
+    return tuple(path.split("."))
+
 
 def _get_path(mapping: Mapping[str, Any], path: str) -> tuple[bool, Any]:
+    return _walk_path(mapping, _split_path(path))
+
+
+def _walk_path(mapping: Mapping[str, Any], path: tuple[str, ...]) -> tuple[bool, Any]:
     current: Any = mapping
-    for key in path.split("."):
-        if not isinstance(current, Mapping) or key not in current:
+    for key in path:
+        if type(current) is not dict and not isinstance(current, Mapping):
+            return False, None
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
             return False, None
-        current = current[key]
     return True, current
 
 
-def _compare(op: str, actual: Any, expected: Any) -> bool:
-    if op == "eq":
-        return actual == expected
-    if op == "ne":
-        return actual != expected
-    if op == "gt":
-        return actual > expected
-    if op == "gte":
-        return actual >= expected
-    if op == "lt":
-        return actual < expected
-    if op == "lte":
-        return actual <= expected
-    if op == "in":
-        return actual in expected
-    if op == "not_in":
-        return actual not in expected
-    raise ValueError(f"unsupported operator: {op}")
-
-
-def _requirement_passed(source: Mapping[str, Any], field: str, op: str, value: Any) -> bool:
-    if op == "exists":
-        exists, _ = _get_path(source, field)
-        return exists
-    if op == "not_exists":
-        exists, _ = _get_path(source, field)
-        return not exists
-
-    exists, actual = _get_path(source, field)
-    if not exists:
-        return False
-    return _compare(op, actual, value)
+_Predicate = Callable[[Mapping[str, Any], Mapping[str, Any]], bool]
+
+_COMPARATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+    "in": lambda actual, expected: actual in expected,
+    "not_in": lambda actual, expected: actual not in expected,
+}
+
+
+def _unsupported_comparator(op: str) -> Callable[[Any, Any], bool]:
+    # Unknown operators still only fail when a requirement actually reaches the comparison.
+    def compare(actual: Any, expected: Any) -> bool:
+        raise ValueError(f"unsupported operator: {op}")
+
+    return compare
+
+
+def _compile_check(path: tuple[str, ...], op: str, value: Any, source: str) -> _Predicate:
+    # Returns predicate(entity_state, features) with the source, path and operator bound.
+    from_entity = source == "entity"
+
+    if op == "exists" or op == "not_exists":
+        expect_exists = op == "exists"
+
+        def check_exists(entity_state: Mapping[str, Any], features: Mapping[str, Any]) -> bool:
+            exists, _ = _walk_path(entity_state if from_entity else features, path)
+            return exists is expect_exists
+
+        return check_exists
+
+    compare = _COMPARATORS.get(op) or _unsupported_comparator(op)
+
+    def check(entity_state: Mapping[str, Any], features: Mapping[str, Any]) -> bool:
+        exists, actual = _walk_path(entity_state if from_entity else features, path)
+        if not exists:
+            return False
+        return compare(actual, value)
+
+    return check
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledGate:
+    hard_checks: tuple[tuple[str, _Predicate], ...]
+    soft_checks: tuple[_Predicate, ...]
+    soft_needed: int
+
+
+def _compile_gate(gate: GateConfig) -> _CompiledGate:
+    return _CompiledGate(
+        hard_checks=tuple(
+            (item.requirement_id, _compile_check(item.field_path, item.op, item.value, item.source))
+            for item in gate.hard_requirements
+        ),
+        soft_checks=tuple(
+            _compile_check(item.field_path, item.op, item.value, item.source) for item in gate.soft_thresholds
+        ),
+        soft_needed=gate.min_soft_passed if gate.min_soft_passed is not None else len(gate.soft_thresholds),
+    )
+
+
+# id(config) -> (weakref to config, {id(gate): compiled gate}). Configs are unhashable
+# (gates carry dicts), so entries are keyed by identity and dropped when the config dies.
+_COMPILED_CONFIGS: dict[int, tuple[weakref.ref[StateMachineConfig], dict[int, _CompiledGate]]] = {}
+
+
+def _compiled_gates(config: StateMachineConfig) -> dict[int, _CompiledGate]:
+    key = id(config)
+    entry = _COMPILED_CONFIGS.get(key)
+    if entry is not None and entry[0]() is config:
+        return entry[1]
+
+    compiled = {id(gate): _compile_gate(gate) for gate in config.gates}
+
+    def _evict(_ref: weakref.ref[StateMachineConfig]) -> None:
+        _COMPILED_CONFIGS.pop(key, None)
+
+    ref = weakref.ref(config, _evict)
+    _COMPILED_CONFIGS[key] = (ref, compiled)
+    return compiled
+
+
+def _as_aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+# Cooldown timestamps repeat across gates and entities in a batch; datetimes are immutable.
+@functools.lru_cache(maxsize=4096)
+def _parse_iso_timestamp(raw: str) -> datetime:
+    return _as_aware(datetime.fromisoformat(raw))
 
 
 def _check_cooldown(gate: GateConfig, entity_state: Mapping[str, Any], now: datetime) -> bool:
-    active, _ = _check_cooldown_with_scope(gate, entity_state, {}, now)
+    active, _ = _check_cooldown_with_scope(gate, entity_state, {}, _as_aware(now))
     return active
 
 
@@ -76,6 +156,7 @@ def _resolve_cooldown_scope_key(gate: GateConfig, features: Mapping[str, Any]) -
 def _check_cooldown_with_scope(
     gate: GateConfig, entity_state: Mapping[str, Any], features: Mapping[str, Any], now: datetime
 ) -> tuple[bool, str | None]:
+    # ``now`` must already be timezone-aware; callers normalize it once per evaluation.
     if gate.cooldown_seconds <= 0:
         return False, None
 
@@ -96,17 +177,12 @@ def _check_cooldown_with_scope(
         return False, scope_key
 
     if isinstance(raw_last, str):
-        last_attempt = datetime.fromisoformat(raw_last)
+        last_attempt = _parse_iso_timestamp(raw_last)
     elif isinstance(raw_last, datetime):
-        last_attempt = raw_last
+        last_attempt = _as_aware(raw_last)
     else:
         return False, scope_key
 
-    if last_attempt.tzinfo is None:
-        last_attempt = last_attempt.replace(tzinfo=timezone.utc)
-    if now.tzinfo is None:
-        now = now.replace(tzinfo=timezone.utc)
-
     return now < (last_attempt + timedelta(seconds=gate.cooldown_seconds)), scope_key
 
 
@@ -119,6 +195,20 @@ def _matches_state(gate: GateConfig, entity_state: Mapping[str, Any]) -> bool:
     return entity_state.get("track") == gate.track
 
 
+def _candidate_gates(config: StateMachineConfig, entity_state: Mapping[str, Any]) -> tuple[GateConfig, ...]:
+    state: Any = entity_state.get("state")
+    track: Any = entity_state.get("track")
+    index = config._gates_by_state
+    try:
+        gates = index.get((state, track))
+        if gates is None:
+            gates = index.get((state, None), ())
+    except TypeError:
+        # Unhashable state/track values cannot hit the index; fall back to the full scan.
+        return tuple(gate for gate in config.gates if _matches_state(gate, entity_state))
+    return gates
+
+
 class Evaluator:
     def evaluate_gates(
         self,
@@ -126,8 +216,19 @@ class Evaluator:
         entity_state: Mapping[str, Any],
         features: Mapping[str, Any],
         now: datetime,
+        include_snapshot: bool = True,
     ) -> list[GateDecision]:
-        return evaluate_gates(config, entity_state, features, now)
+        return evaluate_gates(config, entity_state, features, now, include_snapshot)
+
+    def evaluate_gates_batch(
+        self,
+        config: StateMachineConfig,
+        entity_states: Sequence[Mapping[str, Any]],
+        features_list: Sequence[Mapping[str, Any]],
+        now: datetime,
+        include_snapshot: bool = True,
+    ) -> list[list[GateDecision]]:
+        return evaluate_gates_batch(config, entity_states, features_list, now, include_snapshot)
 
 
 def evaluate_gates(
@@ -135,6 +236,58 @@ def evaluate_gates(
     entity_state: Mapping[str, Any],
     features: Mapping[str, Any],
     now: datetime,
+    include_snapshot: bool = True,
+) -> list[GateDecision]:
+    """Evaluates the gates leaving ``entity_state``'s current state.
+
+    With ``include_snapshot=False`` the attempt snapshot keeps its per-gate
+    metadata but omits the ``feature_snapshot``/``entity_snapshot`` copies of
+    the inputs, which skips the deep copies for callers that never read them.
+    Emission context fields that ``apply_decisions`` derives from the feature
+    snapshot are then ``None``.
+    """
+
+    cooldown_now = _as_aware(now)
+    return _evaluate_entity(
+        config, _compiled_gates(config), entity_state, features, now, now.isoformat(), cooldown_now, include_snapshot
+    )
+
+
+def evaluate_gates_batch(
+    config: StateMachineConfig,
+    entity_states: Sequence[Mapping[str, Any]],
+    features_list: Sequence[Mapping[str, Any]],
+    now: datetime,
+    include_snapshot: bool = True,
+) -> list[list[GateDecision]]:
+    """Evaluates many entities against one config at the same ``now``.
+
+    Returns one decision list per (entity_state, features) pair, identical to
+    calling ``evaluate_gates`` for each pair (``include_snapshot`` included),
+    with the config and timestamp preparation done once for the whole batch.
+    """
+
+    if len(entity_states) != len(features_list):
+        raise ValueError("entity_states and features_list must have the same length")
+
+    compiled = _compiled_gates(config)
+    now_iso = now.isoformat()
+    cooldown_now = _as_aware(now)
+    return [
+        _evaluate_entity(config, compiled, entity_state, features, now, now_iso, cooldown_now, include_snapshot)
+        for entity_state, features in zip(entity_states, features_list)
+    ]
+
+
+def _evaluate_entity(
+    config: StateMachineConfig,
+    compiled: dict[int, _CompiledGate],
+    entity_state: Mapping[str, Any],
+    features: Mapping[str, Any],
+    now: datetime,
+    now_iso: str,
+    cooldown_now: datetime,
+    include_snapshot: bool,
 ) -> list[GateDecision]:
     decisions: list[GateDecision] = []
 
@@ -142,37 +295,34 @@ def evaluate_gates(
     if not isinstance(failure_overrides, Mapping):
         failure_overrides = {}
 
-    for gate in config.gates:
-        if not _matches_state(gate, entity_state):
-            continue
+    # Inputs are copied once per call and the copies are shared by every decision's snapshot.
+    feature_snapshot: dict[str, Any] | None = None
+    entity_snapshot: dict[str, Any] | None = None
 
-        cooldown_active, cooldown_scope_key = _check_cooldown_with_scope(gate, entity_state, features, now)
+    for gate in _candidate_gates(config, entity_state):
+        cooldown_active, cooldown_scope_key = _check_cooldown_with_scope(gate, entity_state, features, cooldown_now)
         passed = not cooldown_active
         reason: str | None = "cooldown_active" if cooldown_active else None
         failed_requirement_id: str | None = None
 
-        feature_source = features
-        entity_source = entity_state
+        checks = compiled[id(gate)]
 
         # Hard requirements short-circuit on first failure.
         if passed:
-            for requirement in gate.hard_requirements:
-                source = entity_source if requirement.source == "entity" else feature_source
-                if not _requirement_passed(source, requirement.field, requirement.op, requirement.value):
+            for requirement_id, check in checks.hard_checks:
+                if not check(entity_state, features):
                     passed = False
-                    failed_requirement_id = requirement.requirement_id
-                    reason = gate.failure_taxonomy.get(requirement.requirement_id, "hard_requirement_failed")
+                    failed_requirement_id = requirement_id
+                    reason = gate.failure_taxonomy.get(requirement_id, "hard_requirement_failed")
                     break
 
-        if passed and gate.soft_thresholds:
+        if passed and checks.soft_checks:
             soft_passes = 0
-            for threshold in gate.soft_thresholds:
-                source = entity_source if threshold.source == "entity" else feature_source
-                if _requirement_passed(source, threshold.field, threshold.op, threshold.value):
+            for check in checks.soft_checks:
+                if check(entity_state, features):
                     soft_passes += 1
 
-            needed = gate.min_soft_passed if gate.min_soft_passed is not None else len(gate.soft_thresholds)
-            if soft_passes < needed:
+            if soft_passes < checks.soft_needed:
                 passed = False
                 reason = "soft_threshold_failed"
 
@@ -186,16 +336,30 @@ def evaluate_gates(
                 passed = False
                 reason = "suppressed"
 
-        snapshot = {
-            "feature_snapshot": deepcopy(dict(features)),
-            "entity_snapshot": deepcopy(dict(entity_state)),
-            "config_version": config.config_version,
-            "gate_version": gate.version,
-            "timestamp": now.isoformat(),
-            "cooldown_active": cooldown_active,
-            "cooldown_scope": gate.cooldown_scope,
-            "cooldown_scope_key": cooldown_scope_key,
-        }
+        snapshot: dict[str, Any]
+        if include_snapshot:
+            if feature_snapshot is None or entity_snapshot is None:
+                feature_snapshot = deepcopy(dict(features))
+                entity_snapshot = deepcopy(dict(entity_state))
+            snapshot = {
+                "feature_snapshot": feature_snapshot,
+                "entity_snapshot": entity_snapshot,
+                "config_version": config.config_version,
+                "gate_version": gate.version,
+                "timestamp": now_iso,
+                "cooldown_active": cooldown_active,
+                "cooldown_scope": gate.cooldown_scope,
+                "cooldown_scope_key": cooldown_scope_key,
+            }
+        else:
+            snapshot = {
+                "config_version": config.config_version,
+                "gate_version": gate.version,
+                "timestamp": now_iso,
+                "cooldown_active": cooldown_active,
+                "cooldown_scope": gate.cooldown_scope,
+                "cooldown_scope_key": cooldown_scope_key,
+            }
 
         transition_attempted = TransitionAttempted(
             gate_id=gate.gate_id,
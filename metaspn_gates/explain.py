@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+from operator import itemgetter
 from typing import Any, Iterable
 
 from .models import GateDecision
@@ -13,7 +15,14 @@ def format_decision_trace(decisions: Iterable[GateDecision]) -> list[dict[str, A
     """
 
     rows: list[dict[str, Any]] = []
+    # Decisions from one evaluation share a timestamp object, so reuse its formatted form.
+    last_timestamp: datetime | None = None
+    last_iso = ""
     for decision in decisions:
+        timestamp = decision.transition_attempted.timestamp
+        if timestamp is not last_timestamp:
+            last_timestamp = timestamp
+            last_iso = timestamp.isoformat()
         reason = decision.reason if decision.reason else ("passed" if decision.passed else "blocked")
         rows.append(
             {
@@ -25,9 +34,9 @@ def format_decision_trace(decisions: Iterable[GateDecision]) -> list[dict[str, A
                 "reason": reason,
                 "failed_requirement_id": decision.failed_requirement_id,
                 "cooldown_active": decision.cooldown_active,
-                "timestamp": decision.transition_attempted.timestamp.isoformat(),
+                "timestamp": last_iso,
             }
         )
 
-    rows.sort(key=lambda r: (r["gate_id"], r["timestamp"]))
+    rows.sort(key=itemgetter("gate_id", "timestamp"))
     return rows
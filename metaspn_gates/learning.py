@@ -1,12 +1,25 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import functools
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from typing import Any, Mapping, Sequence
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speedup
+    np = None  # type: ignore[assignment]
 
-@dataclass(frozen=True)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+# Below this many attempts, array conversion costs more than per-attempt bisection.
+_NUMPY_MIN_ATTEMPTS = 64
+
+
+@dataclass(frozen=True, slots=True)
 class AttemptOutcomeEvaluation:
     attempt_id: str
     gate_id: str
@@ -17,7 +30,7 @@ class AttemptOutcomeEvaluation:
     attempted_at: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalibrationProposal:
     gate_id: str
     recommendation_type: str
@@ -46,6 +59,40 @@ def classify_failure_reason(
     return default_reason
 
 
+@functools.lru_cache(maxsize=1)
+def _load_window_kernel() -> Any | None:
+    try:
+        from ._learning_kernels import window_bounds
+    except ImportError:  # pragma: no cover - numba is an optional speedup
+        return None
+    return window_bounds
+
+
+def _epoch_micros(values: Sequence[datetime]) -> Any:
+    return np.fromiter(((value - _EPOCH) // _MICROSECOND for value in values), dtype=np.int64, count=len(values))
+
+
+def _window_bounds(
+    outcome_ts: Sequence[datetime], starts: Sequence[datetime], ends: Sequence[datetime]
+) -> tuple[list[int], list[int]]:
+    # Index range [lo, hi) of sorted outcome_ts falling inside each inclusive [start, end] window.
+    if np is not None and outcome_ts and len(starts) >= _NUMPY_MIN_ATTEMPTS:
+        outcome_us = _epoch_micros(outcome_ts)
+        start_us = _epoch_micros(starts)
+        end_us = _epoch_micros(ends)
+        kernel = _load_window_kernel()
+        if kernel is not None:
+            lows, highs = kernel(outcome_us, start_us, end_us)
+        else:
+            lows = np.searchsorted(outcome_us, start_us, side="left")
+            highs = np.searchsorted(outcome_us, end_us, side="right")
+        return lows.tolist(), highs.tolist()
+
+    lows = [bisect_left(outcome_ts, start) for start in starts]
+    highs = [bisect_right(outcome_ts, end, lo) for end, lo in zip(ends, lows)]
+    return lows, highs
+
+
 def evaluate_attempt_outcomes(
     attempts: Sequence[Mapping[str, Any]],
     outcomes: Sequence[Mapping[str, Any]],
@@ -63,18 +110,28 @@ def evaluate_attempt_outcomes(
             continue
         normalized_outcomes.append((_as_utc(ts), bool(outcome.get("success"))))
 
-    normalized_outcomes.sort(key=lambda row: row[0])
+    normalized_outcomes.sort(key=itemgetter(0))
+    outcome_ts = [ts for ts, _ in normalized_outcomes]
+    # successes_before[i] counts successful outcomes among the first i sorted outcomes.
+    successes_before = [0]
+    for _, success in normalized_outcomes:
+        successes_before.append(successes_before[-1] + success)
 
-    rows: list[AttemptOutcomeEvaluation] = []
+    timed_attempts: list[tuple[Mapping[str, Any], datetime]] = []
+    window_ends: list[datetime] = []
     for attempt in attempts:
         attempted_at = attempt.get("attempted_at")
         if not isinstance(attempted_at, datetime):
             continue
         attempt_ts = _as_utc(attempted_at)
-        window_end = attempt_ts + timedelta(seconds=outcome_window_seconds)
+        timed_attempts.append((attempt, attempt_ts))
+        window_ends.append(attempt_ts + timedelta(seconds=outcome_window_seconds))
 
-        in_window = [success for ts, success in normalized_outcomes if attempt_ts <= ts <= window_end]
-        success_observed = any(in_window)
+    lows, highs = _window_bounds(outcome_ts, [ts for _, ts in timed_attempts], window_ends)
+
+    rows: list[AttemptOutcomeEvaluation] = []
+    for (attempt, attempt_ts), lo, hi in zip(timed_attempts, lows, highs):
+        success_observed = successes_before[hi] > successes_before[lo]
         passed = bool(attempt.get("passed"))
 
         if passed and success_observed:
@@ -92,13 +149,13 @@ def evaluate_attempt_outcomes(
                 gate_id=str(attempt.get("gate_id", "")),
                 label=label,
                 success_observed=success_observed,
-                outcomes_count=len(in_window),
+                outcomes_count=hi - lo,
                 failure_reason=classify_failure_reason(label=label, taxonomy_map=failure_taxonomy_map),
                 attempted_at=attempt_ts,
             )
         )
 
-    rows.sort(key=lambda r: (r.gate_id, r.attempted_at, r.attempt_id))
+    rows.sort(key=attrgetter("gate_id", "attempted_at", "attempt_id"))
     return rows
 
 
@@ -110,20 +167,22 @@ def generate_calibration_proposals(
     if min_samples < 1:
         raise ValueError("min_samples must be >= 1")
 
-    by_gate: dict[str, list[AttemptOutcomeEvaluation]] = defaultdict(list)
-    for ev in evaluations:
-        by_gate[ev.gate_id].append(ev)
-
     proposals: list[CalibrationProposal] = []
-    for gate_id in sorted(by_gate):
-        samples = by_gate[gate_id]
-        if len(samples) < min_samples:
+    # evaluate_attempt_outcomes output is already ordered by gate_id, which Timsort
+    # confirms in one linear pass, so sorting here only costs real work for unsorted input.
+    by_gate_id = attrgetter("gate_id")
+    for gate_id, group in groupby(sorted(evaluations, key=by_gate_id), key=by_gate_id):
+        total = false_positive = false_negative = 0
+        for sample in group:
+            total += 1
+            label = sample.label
+            if label == "moved_too_early":
+                false_positive += 1
+            elif label == "false_negative":
+                false_negative += 1
+        if total < min_samples:
             continue
 
-        false_positive = sum(1 for s in samples if s.label == "moved_too_early")
-        false_negative = sum(1 for s in samples if s.label == "false_negative")
-        total = len(samples)
-
         fp_rate = false_positive / total
         fn_rate = false_negative / total
 
@@ -161,5 +220,5 @@ def generate_calibration_proposals(
                 )
             )
 
-    proposals.sort(key=lambda p: (p.gate_id, p.recommendation_type, p.direction, p.rationale))
+    proposals.sort(key=attrgetter("gate_id", "recommendation_type", "direction", "rationale"))
     return proposals
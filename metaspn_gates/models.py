@@ -1,29 +1,84 @@
 from __future__ import annotations
 
+import dataclasses
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Mapping
 
 
-@dataclass(frozen=True)
+class _FrozenDict(dict):
+    """Read-only dict for config mappings; still JSON-serializable, picklable and deep-copyable."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("config mappings are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (dict(self),))
+
+
+class _FrozenList(list):
+    """Read-only list for config values; compares equal to plain lists."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("config values are read-only")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly  # type: ignore[assignment]
+    append = extend = insert = pop = remove = reverse = sort = clear = _readonly  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (type(self), (list(self),))
+
+
+def _freeze(value: Any) -> Any:
+    # Loaded configs are shared between callers, so JSON containers inside
+    # requirement values are swapped for read-only equivalents.
+    cls = type(value)
+    if cls is list:
+        return _FrozenList([_freeze(v) for v in value])
+    if cls is dict:
+        return _FrozenDict({k: _freeze(v) for k, v in value.items()})
+    if cls is tuple:
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class HardRequirement:
     requirement_id: str
     field: str
     op: str
     value: Any = None
     source: str = "features"
+    field_path: tuple[str, ...] = dataclasses.field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "field_path", tuple(self.field.split(".")))
+        object.__setattr__(self, "value", _freeze(self.value))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class SoftThreshold:
     threshold_id: str
     field: str
     op: str
     value: Any
     source: str = "features"
+    field_path: tuple[str, ...] = dataclasses.field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "field_path", tuple(self.field.split(".")))
+        object.__setattr__(self, "value", _freeze(self.value))
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class GateConfig:
     gate_id: str
     version: str
@@ -42,14 +97,37 @@ class GateConfig:
     enqueue_tasks_on_pass: tuple[str, ...] = field(default_factory=tuple)
     failure_taxonomy: Mapping[str, str] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Loaded configs are shared between callers, so nested mappings must not be writable.
+        if type(self.failure_taxonomy) is not _FrozenDict:
+            object.__setattr__(self, "failure_taxonomy", _FrozenDict(self.failure_taxonomy))
+
 
 @dataclass(frozen=True)
 class StateMachineConfig:
     config_version: str
     gates: tuple[GateConfig, ...]
 
+    @cached_property
+    def _gates_by_state(self) -> dict[tuple[str, str | None], tuple[GateConfig, ...]]:
+        # (from_state, track) -> candidate gates in config order. Track-agnostic gates
+        # are folded into every track bucket of their state and also live under
+        # (from_state, None), which serves entities whose track has no bucket.
+        tracks_by_state: dict[str, set[str | None]] = {}
+        for gate in self.gates:
+            tracks_by_state.setdefault(gate.from_state, {None}).add(gate.track)
+        index: dict[tuple[str, str | None], tuple[GateConfig, ...]] = {}
+        for state, tracks in tracks_by_state.items():
+            for track in tracks:
+                index[(state, track)] = tuple(
+                    gate
+                    for gate in self.gates
+                    if gate.from_state == state and (gate.track is None or gate.track == track)
+                )
+        return index
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TransitionAttempted:
     gate_id: str
     from_state: str
@@ -61,7 +139,7 @@ class TransitionAttempted:
     snapshot: Mapping[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GateDecision:
     gate_id: str
     gate_version: str
@@ -79,7 +157,7 @@ class GateDecision:
     transition_attempted: TransitionAttempted
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransitionApplied:
     gate_id: str
     from_state: str
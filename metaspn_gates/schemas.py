@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import functools
 import importlib
 from typing import Any, Mapping
 
 
+# The only memoized lookup in this module; _load_backend.cache_clear() resets
+# schemas_available() and build_task_and_emission together.
+@functools.lru_cache(maxsize=1)
 def _load_backend() -> Any | None:
     try:
         return importlib.import_module("metaspn_schemas")
@@ -0,0 +1,21 @@
+import os
+
+from setuptools import setup
+
+# Opt-in native build: METASPN_GATES_USE_MYPYC=1 python -m build
+# compiles the hot modules with mypyc (requires mypy at build time).
+# The default build stays pure Python.
+ext_modules = []
+if os.environ.get("METASPN_GATES_USE_MYPYC", "0") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(
+        [
+            "metaspn_gates/applier.py",
+            "metaspn_gates/config.py",
+            "metaspn_gates/evaluator.py",
+        ],
+        opt_level="3",
+    )
+
+setup(ext_modules=ext_modules)
@@ -1,20 +1,57 @@
 from __future__ import annotations
 
+import dataclasses
 import importlib
 import json
+import pickle
 import unittest
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock
 
-from metaspn_gates import apply_decisions, evaluate_gates, parse_state_machine_config
+from metaspn_gates import (
+    SoftThreshold,
+    apply_decisions,
+    evaluate_gates,
+    evaluate_gates_batch,
+    parse_state_machine_config,
+)
 from metaspn_gates.config import (
     ConfigError,
+    _load_schemas_backend,
+    clear_config_cache,
     load_state_machine_config,
     schemas_backend_available,
     schemas_contract_available,
 )
+from metaspn_gates.evaluator import _compiled_gates
+from metaspn_gates.schemas import _load_backend as _load_emission_backend
+from metaspn_gates.schemas import schemas_available
+
+
+@contextmanager
+def _patch_schemas_import(**kwargs):
+    # The backend lookup is memoized, so reset it around every patched import.
+    _load_schemas_backend.cache_clear()
+    try:
+        with mock.patch("metaspn_gates.config.importlib.import_module", **kwargs) as patched:
+            yield patched
+    finally:
+        _load_schemas_backend.cache_clear()
+
+
+_NOW = datetime(2026, 2, 5, 0, 0, tzinfo=timezone.utc)
+# Read-only inputs for the BASE_CONFIG track-A gate; the evaluator never mutates features.
+_FEATURES_PASS = {"social": {"followers": 1500}, "quality": {"score": 0.9}}
+_FEATURES_FAIL = {"social": {"followers": 10}, "quality": {"score": 0.1}}
+
+
+def _entity(**overrides):
+    return {"state": "candidate", "track": "A", **overrides}
 
 
 BASE_CONFIG = {
@@ -61,6 +98,33 @@ BASE_CONFIG = {
 
 
 class GateTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Parsing is pure and configs are frozen, so one parse serves every test.
+        cls._config = parse_state_machine_config(BASE_CONFIG)
+        cls._m0_config = load_state_machine_config(Path(__file__).parent / "fixtures" / "m0_state_machine_config.json")
+        # Applier-only tests start from the canonical passing evaluation.
+        cls._pass_decisions = tuple(evaluate_gates(cls._config, _entity(), _FEATURES_PASS, _NOW))
+
+        # Loader tests that only read their file share one temp dir with pre-baked payloads.
+        tmp = TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        cls._fallback_path = Path(tmp.name) / "config.yaml"
+        cls._fallback_path.write_text(
+            '{"config_version":"sm.v1","gates":[{"gate_id":"g1","version":"1","from":"a","to":"b"}]}',
+            encoding="utf-8",
+        )
+        cls._backend_path = Path(tmp.name) / "backend.json"
+        cls._backend_path.write_text(
+            '{"config_version":"sm.v2","gates":[{"gate_id":"g1","version":"2","from":"start","to":"next"}]}',
+            encoding="utf-8",
+        )
+        cls._mapping_path = Path(tmp.name) / "mapping.json"
+        cls._mapping_path.write_text(
+            '{"config_version":"sm.v1","gates":[{"gate_id":"g1","version":"1","from":"a","to":"b"}]}',
+            encoding="utf-8",
+        )
+
     def test_m2_recommendation_progression_deterministic(self) -> None:
         fixture_path = Path(__file__).parent / "fixtures" / "m2_recommendation_state_machine_config.json"
         config = load_state_machine_config(fixture_path)
@@ -254,8 +318,7 @@ class GateTests(unittest.TestCase):
         )
 
     def test_m0_fixture_progression_seen_observed_profiled(self) -> None:
-        fixture_path = Path(__file__).parent / "fixtures" / "m0_state_machine_config.json"
-        config = load_state_machine_config(fixture_path)
+        config = self._m0_config
         now = datetime(2026, 2, 6, 0, 0, tzinfo=timezone.utc)
 
         entity_state = {"entity_id": "ent-42", "state": "SEEN", "track": "M0"}
@@ -283,8 +346,7 @@ class GateTests(unittest.TestCase):
         self.assertEqual(second_emissions[0]["task_id"], "task.build_profile")
 
     def test_decision_and_emission_contract_fields_for_workers(self) -> None:
-        fixture_path = Path(__file__).parent / "fixtures" / "m0_state_machine_config.json"
-        config = load_state_machine_config(fixture_path)
+        config = self._m0_config
         now = datetime(2026, 2, 6, 0, 0, tzinfo=timezone.utc)
         entity_state = {"entity_id": "ent-55", "state": "SEEN", "track": "M0"}
         features = {"ingestion": {"resolved_entity_id": "ent-55"}, "profile": {"handle": "p55", "confidence": 0.8}}
@@ -292,26 +354,27 @@ class GateTests(unittest.TestCase):
         decisions = evaluate_gates(config, entity_state, features, now)
         self.assertEqual(len(decisions), 1)
         decision = decisions[0]
-        for attr in (
-            "gate_id",
-            "gate_version",
-            "from_state",
-            "to_state",
-            "passed",
-            "cooldown_active",
-            "cooldown_on",
-            "enqueue_tasks_on_pass",
-            "transition_attempted",
-        ):
-            self.assertTrue(hasattr(decision, attr))
+        self.assertLessEqual(
+            {
+                "gate_id",
+                "gate_version",
+                "from_state",
+                "to_state",
+                "passed",
+                "cooldown_active",
+                "cooldown_on",
+                "enqueue_tasks_on_pass",
+                "transition_attempted",
+            },
+            {f.name for f in dataclasses.fields(decision)},
+        )
 
         attempted = decision.transition_attempted
         self.assertEqual(attempted.gate_id, decision.gate_id)
-        self.assertIn("feature_snapshot", attempted.snapshot)
-        self.assertIn("entity_snapshot", attempted.snapshot)
-        self.assertIn("config_version", attempted.snapshot)
-        self.assertIn("gate_version", attempted.snapshot)
-        self.assertIn("timestamp", attempted.snapshot)
+        self.assertLessEqual(
+            {"feature_snapshot", "entity_snapshot", "config_version", "gate_version", "timestamp"},
+            attempted.snapshot.keys(),
+        )
 
         _, emissions = apply_decisions(entity_state, decisions, caused_by="sig-contract")
         self.assertEqual(len(emissions), 1)
@@ -321,11 +384,11 @@ class GateTests(unittest.TestCase):
         self.assertEqual(emissions[0]["gate_id"], decision.gate_id)
 
     def test_deterministic_gate_evaluation(self) -> None:
-        config = parse_state_machine_config(BASE_CONFIG)
-        entity_state = {"state": "candidate", "track": "A"}
+        config = self._config
+        entity_state = _entity()
         features = {"social": {"followers": 1500}, "quality": {"score": 0.8}}
 
-        now = datetime(2026, 2, 5, 0, 0, tzinfo=timezone.utc)
+        now = _NOW
         d1 = evaluate_gates(config, entity_state, features, now)
         d2 = evaluate_gates(config, entity_state, features, now)
 
@@ -333,17 +396,60 @@ class GateTests(unittest.TestCase):
         self.assertEqual([d.passed for d in d1], [True])
         self.assertEqual([(d.gate_id, d.passed, d.reason) for d in d1], [(d.gate_id, d.passed, d.reason) for d in d2])
 
+    def test_evaluate_gates_batch_matches_per_entity_calls(self) -> None:
+        config = self._config
+        now = _NOW
+        entity_states = [
+            {"state": "candidate", "track": "A"},
+            {"state": "candidate", "track": "B"},
+            {"state": "qualified", "track": "A"},
+        ]
+        features_list = [
+            {"social": {"followers": 1500}, "quality": {"score": 0.8}},
+            {},
+            {"social": {"followers": 10}},
+        ]
+
+        batched = evaluate_gates_batch(config, entity_states, features_list, now)
+        expected = [evaluate_gates(config, e, f, now) for e, f in zip(entity_states, features_list)]
+        self.assertEqual(batched, expected)
+        self.assertEqual([len(d) for d in batched], [1, 1, 0])
+
+        with self.assertRaises(ValueError):
+            evaluate_gates_batch(config, entity_states, features_list[:2], now)
+
+    def test_gate_selection_keeps_config_order_across_tracks(self) -> None:
+        config = parse_state_machine_config(
+            {
+                "config_version": "sm.order",
+                "gates": [
+                    {"gate_id": "g.any.1", "version": "1", "from": "s", "to": "t1"},
+                    {"gate_id": "g.a", "version": "1", "track": "A", "from": "s", "to": "t2"},
+                    {"gate_id": "g.any.2", "version": "1", "from": "s", "to": "t3"},
+                    {"gate_id": "g.b", "version": "1", "track": "B", "from": "s", "to": "t4"},
+                    {"gate_id": "g.other", "version": "1", "from": "x", "to": "t5"},
+                ],
+            }
+        )
+        now = _NOW
+
+        def gate_ids(entity_state: dict) -> list[str]:
+            return [d.gate_id for d in evaluate_gates(config, entity_state, {}, now)]
+
+        self.assertEqual(gate_ids({"state": "s", "track": "A"}), ["g.any.1", "g.any.2", "g.a"])
+        self.assertEqual(gate_ids({"state": "s", "track": "B"}), ["g.any.1", "g.any.2", "g.b"])
+        self.assertEqual(gate_ids({"state": "s", "track": "C"}), ["g.any.1", "g.any.2"])
+        self.assertEqual(gate_ids({"state": "s"}), ["g.any.1", "g.any.2"])
+        self.assertEqual(gate_ids({"state": "s", "track": ["A"]}), ["g.any.1", "g.any.2"])
+        self.assertEqual(gate_ids({"state": "missing", "track": "A"}), [])
+
     def test_cooldown_correctness(self) -> None:
-        config = parse_state_machine_config(BASE_CONFIG)
-        now = datetime(2026, 2, 5, 0, 0, tzinfo=timezone.utc)
+        config = self._config
+        now = _NOW
         recent = now - timedelta(minutes=5)
 
-        entity_state = {
-            "state": "candidate",
-            "track": "A",
-            "gate_cooldowns": {"g.qualify.a": recent.isoformat()},
-        }
-        features = {"social": {"followers": 1500}, "quality": {"score": 0.9}}
+        entity_state = _entity(gate_cooldowns={"g.qualify.a": recent.isoformat()})
+        features = _FEATURES_PASS
 
         decisions = evaluate_gates(config, entity_state, features, now)
         self.assertEqual(len(decisions), 1)
@@ -351,6 +457,50 @@ class GateTests(unittest.TestCase):
         self.assertTrue(decisions[0].cooldown_active)
         self.assertEqual(decisions[0].reason, "cooldown_active")
 
+    def test_requirement_paths_resolve_through_nested_mappings(self) -> None:
+        config = self._config
+        requirement = config.gates[0].hard_requirements[0]
+        self.assertEqual(requirement.field_path, ("social", "followers"))
+
+        now = _NOW
+        entity_state = _entity()
+        features = {"social": OrderedDict(followers=1500), "quality": {"score": 0.9}}
+        self.assertTrue(evaluate_gates(config, entity_state, features, now)[0].passed)
+
+        missing = {"social": {"following": 1500}, "quality": {"score": 0.9}}
+        decision = evaluate_gates(config, entity_state, missing, now)[0]
+        self.assertEqual(decision.failed_requirement_id, "hr.followers")
+
+    def test_compiled_requirement_checks(self) -> None:
+        config = parse_state_machine_config(
+            {
+                "config_version": "sm.ops",
+                "gates": [
+                    {
+                        "gate_id": "g.ops",
+                        "version": "1",
+                        "from": "s",
+                        "to": "t",
+                        "hard_requirements": [
+                            {"requirement_id": "hr.tier", "field": "tier", "op": "in", "value": ["gold"], "source": "entity"},
+                            {"requirement_id": "hr.flag", "field": "flags.blocked", "op": "not_exists"},
+                            {"requirement_id": "hr.odd", "field": "odd", "op": "approx", "value": 1},
+                        ],
+                    }
+                ],
+            }
+        )
+        now = _NOW
+        entity_state = {"state": "s", "tier": "gold"}
+
+        self.assertEqual(evaluate_gates(config, {"state": "s", "tier": "iron"}, {}, now)[0].failed_requirement_id, "hr.tier")
+        self.assertEqual(evaluate_gates(config, entity_state, {"flags": {"blocked": None}}, now)[0].failed_requirement_id, "hr.flag")
+        self.assertEqual(evaluate_gates(config, entity_state, {}, now)[0].failed_requirement_id, "hr.odd")
+        with self.assertRaises(ValueError):
+            evaluate_gates(config, entity_state, {"odd": 1}, now)
+
+        self.assertIs(_compiled_gates(config), _compiled_gates(config))
+
     def test_config_parsing_validation(self) -> None:
         bad = {
             "config_version": "x",
@@ -367,11 +517,27 @@ class GateTests(unittest.TestCase):
         with self.assertRaises(ConfigError):
             parse_state_machine_config(bad)
 
+        duplicate = {"config_version": "x", "gates": [{"gate_id": "a", "version": "1", "from": "s1", "to": "s2"}] * 2}
+        with self.assertRaisesRegex(ConfigError, "duplicate gate_id: a"):
+            parse_state_machine_config(duplicate)
+
+    def test_config_accepts_str_subclass_task_ids(self) -> None:
+        class TaskId(str):
+            pass
+
+        config = parse_state_machine_config(
+            {
+                "config_version": "x",
+                "gates": [{"gate_id": "a", "version": "1", "from": "s1", "to": "s2", "enqueue_tasks_on_pass": [TaskId("task.review")]}],
+            }
+        )
+        self.assertEqual(config.gates[0].enqueue_tasks_on_pass, ("task.review",))
+
     def test_snapshot_completeness(self) -> None:
-        config = parse_state_machine_config(BASE_CONFIG)
-        now = datetime(2026, 2, 5, 0, 0, tzinfo=timezone.utc)
-        entity_state = {"state": "candidate", "track": "A"}
-        features = {"social": {"followers": 1500}, "quality": {"score": 0.9}}
+        config = self._config
+        now = _NOW
+        entity_state = _entity()
+        features = _FEATURES_PASS
 
         decisions = evaluate_gates(config, entity_state, features, now)
         self.assertEqual(len(decisions), 1)
@@ -382,13 +548,45 @@ class GateTests(unittest.TestCase):
         self.assertIn("gate_version", snapshot)
         self.assertIn("timestamp", snapshot)
 
-    def test_apply_decisions_emits_and_transitions(self) -> None:
-        config = parse_state_machine_config(BASE_CONFIG)
-        now = datetime(2026, 2, 5, 0, 0, tzinfo=timezone.utc)
-        entity_state = {"state": "candidate", "track": "A"}
-        features = {"social": {"followers": 1500}, "quality": {"score": 0.9}}
+    def test_snapshot_inputs_copied_once_per_call(self) -> None:
+        raw = json.loads(json.dumps(BASE_CONFIG))
+        raw["gates"][1]["track"] = None
+        config = parse_state_machine_config(raw)
+        now = _NOW
+        entity_state = _entity()
+        features = _FEATURES_PASS
 
         decisions = evaluate_gates(config, entity_state, features, now)
+        self.assertEqual(len(decisions), 2)
+        first, second = (d.transition_attempted.snapshot for d in decisions)
+        self.assertIs(first["feature_snapshot"], second["feature_snapshot"])
+        self.assertIs(first["entity_snapshot"], second["entity_snapshot"])
+        self.assertIsNot(first["feature_snapshot"]["social"], features["social"])
+        self.assertEqual(first["gate_version"], "1")
+
+    def test_snapshot_inputs_can_be_omitted(self) -> None:
+        config = self._config
+        now = _NOW
+        entity_state = _entity()
+        features = _FEATURES_PASS
+
+        full = evaluate_gates(config, entity_state, features, now)
+        lean = evaluate_gates(config, entity_state, features, now, include_snapshot=False)
+
+        self.assertEqual([(d.gate_id, d.passed, d.reason) for d in lean], [(d.gate_id, d.passed, d.reason) for d in full])
+        snapshot = lean[0].transition_attempted.snapshot
+        self.assertNotIn("feature_snapshot", snapshot)
+        self.assertNotIn("entity_snapshot", snapshot)
+        self.assertEqual(snapshot["timestamp"], now.isoformat())
+        self.assertEqual(snapshot["gate_version"], "1")
+
+        _, emissions = apply_decisions(entity_state, lean, caused_by="sig-lean")
+        self.assertEqual(emissions[0]["task_id"], "task.review")
+        self.assertIsNone(emissions[0]["channel"])
+
+    def test_apply_decisions_emits_and_transitions(self) -> None:
+        entity_state = _entity()
+        decisions = list(self._pass_decisions)
         new_state, emissions = apply_decisions(entity_state, decisions, caused_by="sig-123")
 
         self.assertEqual(new_state["state"], "qualified")
@@ -397,13 +595,104 @@ class GateTests(unittest.TestCase):
         self.assertEqual(len(emissions), 1)
         self.assertEqual(emissions[0]["task_id"], "task.review")
 
-    def test_apply_decisions_schema_emissions(self) -> None:
-        config = parse_state_machine_config(BASE_CONFIG)
-        now = datetime(2026, 2, 5, 0, 0, tzinfo=timezone.utc)
-        entity_state = {"entity_id": "ent-1", "state": "candidate", "track": "A"}
-        features = {"social": {"followers": 1500}, "quality": {"score": 0.9}}
+    def test_apply_decisions_does_not_mutate_input_state(self) -> None:
+        config = self._config
+        now = _NOW
+        prior_attempt = {"gate_id": "g.qualify.a", "passed": False}
+        entity_state = _entity(
+            profile={"handle": "cow"},
+            gate_attempts=[prior_attempt],
+            gate_cooldowns={"g.other": "2026-02-01T00:00:00+00:00"},
+            gate_cooldowns_scoped={"g.qualify.a": {"channel:email": "2026-02-01T00:00:00+00:00"}},
+        )
+        features = _FEATURES_PASS
+        before = json.loads(json.dumps(entity_state))
+
+        decisions = evaluate_gates(config, entity_state, features, now)
+        new_state, _ = apply_decisions(entity_state, decisions, caused_by="sig-cow")
 
+        self.assertEqual(entity_state, before)
+        self.assertEqual(new_state["state"], "qualified")
+        self.assertEqual(new_state["gate_attempts"][0], prior_attempt)
+        self.assertEqual(len(new_state["gate_attempts"]), 2)
+        self.assertEqual(set(new_state["gate_cooldowns"]), {"g.other", "g.qualify.a"})
+        self.assertEqual(new_state["profile"], {"handle": "cow"})
+        self.assertEqual(list(new_state)[:3], ["state", "track", "profile"])
+
+    def test_apply_decisions_shares_untouched_nested_state(self) -> None:
+        prior_attempt = {"gate_id": "g.qualify.a", "passed": False}
+        entity_state = _entity(profile={"handle": "cow"}, gate_attempts=[prior_attempt])
+
+        new_state, _ = apply_decisions(entity_state, list(self._pass_decisions))
+
+        self.assertIs(new_state["profile"], entity_state["profile"])
+        self.assertIsNot(new_state["gate_attempts"], entity_state["gate_attempts"])
+        self.assertIs(new_state["gate_attempts"][0], prior_attempt)
+        self.assertEqual(entity_state["gate_attempts"], [prior_attempt])
+
+    def test_apply_decisions_snapshot_policies(self) -> None:
+        config = self._config
+        now = _NOW
+        entity_state = _entity()
+        features = _FEATURES_PASS
         decisions = evaluate_gates(config, entity_state, features, now)
+        snapshot = decisions[0].transition_attempted.snapshot
+
+        copied, _ = apply_decisions(entity_state, decisions)
+        self.assertEqual(copied["gate_attempts"][0]["snapshot"], snapshot)
+        self.assertIsNot(copied["gate_attempts"][0]["snapshot"]["feature_snapshot"], snapshot["feature_snapshot"])
+        self.assertIsNot(copied["gate_attempts"][0]["snapshot"], copied["transitions_applied"][0]["snapshot"])
+
+        shallow, _ = apply_decisions(entity_state, decisions, snapshot_policy="shallow")
+        self.assertIsNot(shallow["gate_attempts"][0]["snapshot"], snapshot)
+        self.assertIs(shallow["gate_attempts"][0]["snapshot"]["feature_snapshot"], snapshot["feature_snapshot"])
+
+        shared, _ = apply_decisions(entity_state, decisions, snapshot_policy="share")
+        self.assertIs(shared["gate_attempts"][0]["snapshot"], snapshot)
+        self.assertIs(shared["transitions_applied"][0]["snapshot"], snapshot)
+
+        with self.assertRaises(ValueError):
+            apply_decisions(entity_state, decisions, snapshot_policy="bogus")
+
+    def test_apply_decisions_copies_cyclic_and_shared_snapshots(self) -> None:
+        shared = {"score": 0.9}
+        social = {"followers": 1500}
+        social["self"] = social
+        features = {"social": social, "quality": shared, "quality_alias": shared}
+        decisions = evaluate_gates(self._config, _entity(), features, _NOW)
+
+        new_state, _ = apply_decisions(_entity(), decisions)
+
+        snapshot = new_state["gate_attempts"][0]["snapshot"]["feature_snapshot"]
+        self.assertIs(snapshot["social"]["self"], snapshot["social"])
+        self.assertIs(snapshot["quality"], snapshot["quality_alias"])
+        self.assertIsNot(snapshot, decisions[0].transition_attempted.snapshot["feature_snapshot"])
+        self.assertEqual(snapshot["quality"], shared)
+
+    def test_apply_decisions_without_decisions(self) -> None:
+        entity_state = {"state": "candidate", "gate_attempts": [{"gate_id": "g.qualify.a"}]}
+
+        new_state, emissions = apply_decisions(entity_state, [])
+
+        self.assertEqual(emissions, [])
+        self.assertEqual(
+            new_state,
+            {
+                "state": "candidate",
+                "gate_attempts": [{"gate_id": "g.qualify.a"}],
+                "transitions_applied": [],
+                "gate_cooldowns": {},
+                "gate_cooldowns_scoped": {},
+            },
+        )
+        self.assertIsNot(new_state["gate_attempts"], entity_state["gate_attempts"])
+
+        with self.assertRaises(ValueError):
+            apply_decisions({"state": "candidate", "gate_cooldowns": []}, [])
+
+    def test_apply_decisions_schema_emissions(self) -> None:
+        entity_state = _entity(entity_id="ent-1")
+        decisions = list(self._pass_decisions)
         with mock.patch("metaspn_gates.applier.schemas_available", return_value=True):
             with mock.patch(
                 "metaspn_gates.applier.build_task_and_emission",
@@ -414,40 +703,209 @@ class GateTests(unittest.TestCase):
         self.assertEqual(emissions[0]["schema"]["task"]["task_id"], "task.review")
 
     def test_apply_decisions_schema_emissions_require_entity_id(self) -> None:
-        config = parse_state_machine_config(BASE_CONFIG)
-        now = datetime(2026, 2, 5, 0, 0, tzinfo=timezone.utc)
-        entity_state = {"state": "candidate", "track": "A"}
-        features = {"social": {"followers": 1500}, "quality": {"score": 0.9}}
-
-        decisions = evaluate_gates(config, entity_state, features, now)
+        entity_state = _entity()
+        decisions = list(self._pass_decisions)
         with mock.patch("metaspn_gates.applier.schemas_available", return_value=True):
             with self.assertRaises(ValueError):
                 apply_decisions(entity_state, decisions, caused_by="sig-123", use_schema_envelopes=True)
 
     def test_failure_override_hook(self) -> None:
-        config = parse_state_machine_config(BASE_CONFIG)
-        now = datetime(2026, 2, 5, 0, 0, tzinfo=timezone.utc)
-        entity_state = {
-            "state": "candidate",
-            "track": "A",
-            "failure_overrides": {"g.qualify.a": "manual_override_reason"},
-        }
-        features = {"social": {"followers": 10}, "quality": {"score": 0.1}}
+        config = self._config
+        now = _NOW
+        entity_state = _entity(failure_overrides={"g.qualify.a": "manual_override_reason"})
+        features = _FEATURES_FAIL
 
         decisions = evaluate_gates(config, entity_state, features, now)
         self.assertEqual(decisions[0].reason, "manual_override_reason")
 
     def test_load_state_machine_config_json_fallback(self) -> None:
-        with mock.patch("metaspn_gates.config.importlib.import_module", side_effect=ImportError):
+        with _patch_schemas_import(side_effect=ImportError):
+            config = load_state_machine_config(self._fallback_path)
+            self.assertEqual(config.config_version, "sm.v1")
+            self.assertEqual(config.gates[0].gate_id, "g1")
+
+    def test_load_state_machine_config_matches_stdlib_json_numbers(self) -> None:
+        decoders: list[tuple[str, dict]] = [("default", {})]
+        if importlib.util.find_spec("orjson") is not None:
+            import orjson
+
+            # The no-msgspec install: orjson decodes the bytes without the typed fast path.
+            decoders.append(
+                (
+                    "orjson",
+                    {"_json_loads": orjson.loads, "_JSON_DECODE_ERRORS": (json.JSONDecodeError,), "_load_fast_decoder": lambda: None},
+                )
+            )
+        values = {
+            "wide": 123456789012345678901234567890,
+            "below_int64": -9223372036854775809,
+            "unbounded": float("inf"),
+        }
+
+        for decoder, patches in decoders:
+            for name, expected in values.items():
+                with self.subTest(decoder=decoder, value=name):
+                    raw = json.dumps(
+                        {
+                            "config_version": "sm.v1",
+                            "gates": [
+                                {
+                                    "gate_id": "g1",
+                                    "version": "1",
+                                    "from": "a",
+                                    "to": "b",
+                                    "hard_requirements": [{"requirement_id": "hr.x", "field": "x", "op": "eq", "value": expected}],
+                                }
+                            ],
+                        }
+                    )
+                    decoder_patch = mock.patch.multiple("metaspn_gates.config", **patches) if patches else nullcontext()
+                    with decoder_patch, _patch_schemas_import(side_effect=ImportError):
+                        with TemporaryDirectory() as tmp:
+                            path = Path(tmp) / "config.json"
+                            path.write_text(raw, encoding="utf-8")
+                            config = load_state_machine_config(path)
+
+                    self.assertEqual(config, parse_state_machine_config(json.loads(raw)))
+                    value = config.gates[0].hard_requirements[0].value
+                    self.assertIs(type(value), type(expected))
+                    self.assertEqual(value, expected)
+                    self.assertTrue(evaluate_gates(config, {"state": "a"}, {"x": expected}, _NOW)[0].passed)
+
+    @unittest.skipIf(importlib.util.find_spec("msgspec") is None, "msgspec is not installed in this environment")
+    def test_msgspec_json_decoder_retries_with_stdlib_json(self) -> None:
+        import msgspec
+
+        with mock.patch.multiple(
+            "metaspn_gates.config",
+            _json_loads=msgspec.json.Decoder().decode,
+            _JSON_DECODE_ERRORS=(msgspec.DecodeError,),
+        ):
+            with _patch_schemas_import(side_effect=ImportError):
+                with TemporaryDirectory() as tmp:
+                    path = Path(tmp) / "config.json"
+                    path.write_text(
+                        '{"config_version":"sm.v1","gates":[{"gate_id":"g1","version":"1","from":"a","to":"b",'
+                        '"soft_thresholds":[{"threshold_id":"st.nan","field":"x","op":"lt","value":NaN}]}]}',
+                        encoding="utf-8",
+                    )
+                    value = load_state_machine_config(path).gates[0].soft_thresholds[0].value
+                    self.assertNotEqual(value, value)
+
+                    path.write_text("gates: [", encoding="utf-8")
+                    with self.assertRaisesRegex(ConfigError, "provide JSON content"):
+                        load_state_machine_config(path)
+
+    def test_load_state_machine_config_caches_until_file_changes(self) -> None:
+        with _patch_schemas_import(side_effect=ImportError):
             with TemporaryDirectory() as tmp:
-                path = Path(tmp) / "config.yaml"
+                path = Path(tmp) / "config.json"
                 path.write_text(
                     '{"config_version":"sm.v1","gates":[{"gate_id":"g1","version":"1","from":"a","to":"b"}]}',
                     encoding="utf-8",
                 )
-                config = load_state_machine_config(path)
-                self.assertEqual(config.config_version, "sm.v1")
-                self.assertEqual(config.gates[0].gate_id, "g1")
+                first = load_state_machine_config(path)
+                self.assertIs(load_state_machine_config(str(path)), first)
+
+                path.write_text(
+                    '{"config_version":"sm.v2","gates":[{"gate_id":"g1","version":"2","track":"A","from":"a","to":"b"}]}',
+                    encoding="utf-8",
+                )
+                second = load_state_machine_config(path)
+                self.assertIsNot(second, first)
+                self.assertEqual(second.config_version, "sm.v2")
+
+    def test_cached_configs_are_read_only_and_bounded(self) -> None:
+        payload = '{"config_version":"sm.v1","gates":[{"gate_id":"g1","version":"1","from":"a","to":"b","failure_taxonomy":{"hr.x":"x_missing"}}]}'
+        clear_config_cache()
+        with mock.patch("metaspn_gates.config._CONFIG_CACHE_MAX", 1), _patch_schemas_import(side_effect=ImportError):
+            with TemporaryDirectory() as tmp:
+                first_path, second_path = Path(tmp) / "first.json", Path(tmp) / "second.json"
+                first_path.write_text(payload, encoding="utf-8")
+                second_path.write_text(payload, encoding="utf-8")
+
+                first = load_state_machine_config(first_path)
+                taxonomy = first.gates[0].failure_taxonomy
+                with self.assertRaises(TypeError):
+                    taxonomy["hr.x"] = "changed"
+                with self.assertRaises(TypeError):
+                    taxonomy.update({"hr.y": "y"})
+                self.assertEqual(load_state_machine_config(first_path).gates[0].failure_taxonomy, {"hr.x": "x_missing"})
+
+                load_state_machine_config(second_path)
+                self.assertIsNot(load_state_machine_config(first_path), first)
+                reloaded = load_state_machine_config(first_path)
+                clear_config_cache()
+                self.assertIsNot(load_state_machine_config(first_path), reloaded)
+
+        self.assertEqual(pickle.loads(pickle.dumps(first)), first)
+        self.assertEqual(deepcopy(taxonomy), taxonomy)
+        self.assertEqual(json.loads(json.dumps(taxonomy)), {"hr.x": "x_missing"})
+
+    def test_cached_requirement_values_are_read_only(self) -> None:
+        payload = json.dumps(
+            {
+                "config_version": "sm.v1",
+                "gates": [
+                    {
+                        "gate_id": "g1",
+                        "version": "1",
+                        "from": "a",
+                        "to": "b",
+                        "hard_requirements": [
+                            {"requirement_id": "hr.tier", "field": "tier", "op": "in", "value": ["gold"], "source": "entity"},
+                            {"requirement_id": "hr.tags", "field": "tags", "op": "eq", "value": {"kind": ["a", "b"]}},
+                        ],
+                    }
+                ],
+            }
+        )
+        clear_config_cache()
+        with _patch_schemas_import(side_effect=ImportError), TemporaryDirectory() as tmp:
+            path = Path(tmp) / "config.json"
+            path.write_text(payload, encoding="utf-8")
+            config = load_state_machine_config(path)
+            tiers, tags = (r.value for r in config.gates[0].hard_requirements)
+            for mutate in (
+                lambda: tiers.append("iron"),
+                lambda: tiers.__iadd__(["iron"]),
+                lambda: tiers.__setitem__(0, "iron"),
+                lambda: tags.__setitem__("kind", []),
+                lambda: tags["kind"].append("c"),
+            ):
+                with self.assertRaises(TypeError):
+                    mutate()
+            self.assertIs(load_state_machine_config(path), config)
+
+        features = {"tags": {"kind": ["a", "b"]}}
+        self.assertEqual(tiers, ["gold"])
+        self.assertEqual(evaluate_gates(config, {"state": "a", "tier": "iron"}, features, _NOW)[0].failed_requirement_id, "hr.tier")
+        self.assertTrue(evaluate_gates(config, {"state": "a", "tier": "gold"}, features, _NOW)[0].passed)
+        self.assertEqual(pickle.loads(pickle.dumps(config)), config)
+        self.assertEqual(deepcopy(config), config)
+        self.assertEqual(json.loads(json.dumps(tags)), {"kind": ["a", "b"]})
+        with self.assertRaises(TypeError):
+            SoftThreshold(threshold_id="st", field="x", op="eq", value=[1]).value.append(2)
+
+    @unittest.skipIf(importlib.util.find_spec("msgspec") is None, "msgspec is not installed in this environment")
+    def test_msgspec_fast_path_matches_mapping_parser(self) -> None:
+        from metaspn_gates import _fastconfig
+
+        with _patch_schemas_import(side_effect=ImportError):
+            for fixture_path in sorted((Path(__file__).parent / "fixtures").glob("*.json")):
+                with self.subTest(fixture=fixture_path.name):
+                    raw = fixture_path.read_bytes()
+                    self.assertEqual(
+                        _fastconfig.decode_state_machine_config(raw),
+                        parse_state_machine_config(json.loads(raw)),
+                    )
+
+            lenient = {"config_version": "sm.v1", "gates": [{"gate_id": "g1", "version": "1", "from": "a", "to": "b", "failure_taxonomy": {"x": 1}}]}
+            self.assertIsNone(_fastconfig.decode_state_machine_config(json.dumps(lenient).encode()))
+            with TemporaryDirectory() as tmp:
+                path = Path(tmp) / "config.json"
+                path.write_text(json.dumps(lenient), encoding="utf-8")
+                self.assertEqual(load_state_machine_config(path).gates[0].failure_taxonomy, {"x": "1"})
 
     def test_load_state_machine_config_uses_schemas_backend(self) -> None:
         class FakeSchemas:
@@ -476,24 +934,64 @@ class GateTests(unittest.TestCase):
                 out["config_version"] = "sm.v2.validated"
                 return out
 
-        with mock.patch("metaspn_gates.config.importlib.import_module", return_value=FakeSchemas):
-            with TemporaryDirectory() as tmp:
-                path = Path(tmp) / "config.json"
-                path.write_text(
-                    '{"config_version":"sm.v2","gates":[{"gate_id":"g1","version":"2","from":"start","to":"next"}]}',
+        with _patch_schemas_import(return_value=FakeSchemas):
+            config = load_state_machine_config(self._backend_path)
+            self.assertEqual(config.config_version, "sm.v2.validated")
+            self.assertEqual(config.gates[0].version, "2")
+            self.assertEqual(FakeSchemas.seen_payload_type, dict)
+
+    def test_schema_parser_call_shape_follows_hook_signature(self) -> None:
+        calls: list[int] = []
+        transient = [TypeError("rejected for its own reasons")]
+
+        class PathSchemas:
+            @staticmethod
+            def parse_state_machine_config(payload: dict, path: str) -> dict:
+                calls.append(2)
+                return payload
+
+        class VariadicSchemas:
+            @staticmethod
+            def parse_state_machine_config(*args: object) -> dict:
+                calls.append(len(args))
+                if len(args) == 1 and transient:
+                    raise transient.pop()
+                return args[0]
+
+        with TemporaryDirectory() as tmp:
+            for name in ("a.json", "b.json", "c.json"):
+                (Path(tmp) / name).write_text(
+                    '{"config_version":"sm.v1","gates":[{"gate_id":"g1","version":"1","from":"a","to":"b"}]}',
                     encoding="utf-8",
                 )
-                config = load_state_machine_config(path)
-                self.assertEqual(config.config_version, "sm.v2.validated")
-                self.assertEqual(config.gates[0].version, "2")
-                self.assertEqual(FakeSchemas.seen_payload_type, dict)
+
+            with _patch_schemas_import(return_value=PathSchemas):
+                self.assertEqual(load_state_machine_config(Path(tmp) / "a.json").gates[0].gate_id, "g1")
+            self.assertEqual(calls, [2])
+
+            # A TypeError raised by the hook itself must not pin the two-argument shape.
+            calls.clear()
+            with _patch_schemas_import(return_value=VariadicSchemas):
+                for name in ("b.json", "c.json"):
+                    self.assertEqual(load_state_machine_config(Path(tmp) / name).gates[0].gate_id, "g1")
+            self.assertEqual(calls, [1, 2, 1])
 
     def test_schemas_backend_available_helper(self) -> None:
-        with mock.patch("metaspn_gates.config.importlib.import_module", return_value=object()):
+        with _patch_schemas_import(return_value=object()):
             self.assertTrue(schemas_backend_available())
-        with mock.patch("metaspn_gates.config.importlib.import_module", side_effect=ImportError):
+        with _patch_schemas_import(side_effect=ImportError):
             self.assertFalse(schemas_backend_available())
 
+    def test_schemas_available_follows_backend_cache_reset(self) -> None:
+        _load_emission_backend.cache_clear()
+        self.addCleanup(_load_emission_backend.cache_clear)
+        with mock.patch("metaspn_gates.schemas.importlib.import_module", side_effect=ImportError):
+            self.assertFalse(schemas_available())
+        with mock.patch("metaspn_gates.schemas.importlib.import_module", return_value=object()):
+            self.assertFalse(schemas_available())
+            _load_emission_backend.cache_clear()
+            self.assertTrue(schemas_available())
+
     def test_schemas_contract_available_helper(self) -> None:
         class FakeSchemas:
             @staticmethod
@@ -504,10 +1002,10 @@ class GateTests(unittest.TestCase):
             def validate_state_machine_config(payload: dict) -> dict:
                 return payload
 
-        with mock.patch("metaspn_gates.config.importlib.import_module", return_value=FakeSchemas):
+        with _patch_schemas_import(return_value=FakeSchemas):
             self.assertTrue(schemas_contract_available())
 
-        with mock.patch("metaspn_gates.config.importlib.import_module", return_value=object()):
+        with _patch_schemas_import(return_value=object()):
             self.assertFalse(schemas_contract_available())
 
     def test_parse_state_machine_config_runs_backend_validation(self) -> None:
@@ -521,7 +1019,7 @@ class GateTests(unittest.TestCase):
                 out["config_version"] = "validated"
                 return out
 
-        with mock.patch("metaspn_gates.config.importlib.import_module", return_value=FakeSchemas):
+        with _patch_schemas_import(return_value=FakeSchemas):
             config = parse_state_machine_config(
                 {"config_version": "raw", "gates": [{"gate_id": "g1", "version": "1", "from": "a", "to": "b"}]}
             )
@@ -540,15 +1038,9 @@ class GateTests(unittest.TestCase):
             def validate_state_machine_config(payload: dict) -> dict:
                 return payload
 
-        with mock.patch("metaspn_gates.config.importlib.import_module", return_value=FakeSchemas):
-            with TemporaryDirectory() as tmp:
-                path = Path(tmp) / "config.json"
-                path.write_text(
-                    '{"config_version":"sm.v1","gates":[{"gate_id":"g1","version":"1","from":"a","to":"b"}]}',
-                    encoding="utf-8",
-                )
-                config = load_state_machine_config(path)
-                self.assertEqual(config.gates[0].gate_id, "g1")
+        with _patch_schemas_import(return_value=FakeSchemas):
+            config = load_state_machine_config(self._mapping_path)
+            self.assertEqual(config.gates[0].gate_id, "g1")
 
     def test_real_schemas_backend_present_path_stays_stable(self) -> None:
         spec = importlib.util.find_spec("metaspn_schemas")
@@ -557,15 +1049,21 @@ class GateTests(unittest.TestCase):
 
         backend = importlib.import_module("metaspn_schemas")
         fixture_path = Path(__file__).parent / "fixtures" / "m0_state_machine_config.json"
-        payload = json.loads(fixture_path.read_text(encoding="utf-8"))
-
-        parse_hook = getattr(backend, "parse_state_machine_config", None)
-        if callable(parse_hook):
-            with mock.patch.object(backend, "parse_state_machine_config", side_effect=TypeError("expects mapping")):
+        raw = fixture_path.read_bytes()
+        payload = json.loads(raw)
+
+        # Bypass the path cache so the loader really reads, and serve it the bytes
+        # already read above instead of a second disk read.
+        clear_config_cache()
+        with mock.patch.object(Path, "read_bytes", return_value=raw) as read_bytes:
+            parse_hook = getattr(backend, "parse_state_machine_config", None)
+            if callable(parse_hook):
+                with mock.patch.object(backend, "parse_state_machine_config", side_effect=TypeError("expects mapping")):
+                    config = load_state_machine_config(fixture_path)
+            else:
+                # Older schemas builds may not expose the parse hook at package root.
                 config = load_state_machine_config(fixture_path)
-        else:
-            # Older schemas builds may not expose the parse hook at package root.
-            config = load_state_machine_config(fixture_path)
+        read_bytes.assert_called_once_with()
 
         self.assertEqual(config.config_version, payload["config_version"])
         self.assertEqual(
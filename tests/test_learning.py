@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import importlib.util
 import unittest
 from datetime import datetime, timedelta, timezone
+from typing import Final
+from unittest import mock
 
 from metaspn_gates.learning import (
     classify_failure_reason,
@@ -10,56 +13,103 @@ from metaspn_gates.learning import (
 )
 
 
-class LearningTests(unittest.TestCase):
-    def test_moved_too_early_detection(self) -> None:
-        now = datetime(2026, 2, 6, 12, 0, tzinfo=timezone.utc)
-        attempts = [{"attempt_id": "a1", "gate_id": "g1", "attempted_at": now, "passed": True}]
-        outcomes = [{"timestamp": now + timedelta(minutes=20), "success": True}]
+_NOW: Final = datetime(2026, 2, 6, 12, 0, tzinfo=timezone.utc)
+# Attempt/outcome instants shared by the table cases, keyed by offset in seconds.
+_AT: Final = {s: _NOW + timedelta(seconds=s) for s in (-1, 0, 20, 30, 31, 60, 75, 1200)}
+# Calibration fixture instants, indexed in attempt-then-outcome order.
+_OFFSETS: Final = tuple(_NOW + timedelta(minutes=m) for m in (0, 1, 2, 3, 5, 6))
+
 
-        rows = evaluate_attempt_outcomes(
-            attempts,
-            outcomes,
-            outcome_window_seconds=300,
-            failure_taxonomy_map={"moved_too_early": "window_miss"},
+class LearningTests(unittest.TestCase):
+    def test_evaluate_attempt_outcome_cases(self) -> None:
+        at = _AT
+        # name, attempts, outcomes, window seconds, taxonomy, expected (label, failure_reason, outcomes_count, success_observed)
+        cases = (
+            (
+                "moved_too_early",
+                [{"attempt_id": "a1", "gate_id": "g1", "attempted_at": at[0], "passed": True}],
+                [{"timestamp": at[1200], "success": True}],
+                300,
+                {"moved_too_early": "window_miss"},
+                [("moved_too_early", "window_miss", 0, False)],
+            ),
+            (
+                "false_negative_and_false_positive",
+                [
+                    {"attempt_id": "a1", "gate_id": "g1", "attempted_at": at[0], "passed": True},
+                    {"attempt_id": "a2", "gate_id": "g1", "attempted_at": at[60], "passed": False},
+                ],
+                [{"timestamp": at[20], "success": False}, {"timestamp": at[75], "success": True}],
+                30,
+                None,
+                [("moved_too_early", "unknown_failure", 1, False), ("false_negative", "unknown_failure", 1, True)],
+            ),
+            (
+                "window_bounds_are_inclusive",
+                [{"attempt_id": "a1", "gate_id": "g1", "attempted_at": at[0], "passed": False}],
+                [
+                    {"timestamp": at[-1], "success": True},
+                    {"timestamp": at[0], "success": False},
+                    {"timestamp": at[30], "success": True},
+                    {"timestamp": at[31], "success": True},
+                ],
+                30,
+                None,
+                [("false_negative", "unknown_failure", 2, True)],
+            ),
         )
-        self.assertEqual(len(rows), 1)
-        self.assertEqual(rows[0].label, "moved_too_early")
-        self.assertEqual(rows[0].failure_reason, "window_miss")
+        for name, attempts, outcomes, window, taxonomy, expected in cases:
+            with self.subTest(name=name):
+                rows = evaluate_attempt_outcomes(
+                    attempts,
+                    outcomes,
+                    outcome_window_seconds=window,
+                    failure_taxonomy_map=taxonomy,
+                )
+                self.assertEqual(
+                    [(r.label, r.failure_reason, r.outcomes_count, r.success_observed) for r in rows],
+                    expected,
+                )
 
-    def test_false_negative_and_false_positive_behavior(self) -> None:
-        now = datetime(2026, 2, 6, 12, 0, tzinfo=timezone.utc)
+    @unittest.skipIf(importlib.util.find_spec("numpy") is None, "numpy not installed")
+    def test_vectorized_windows_match_bisection(self) -> None:
+        now = _NOW
         attempts = [
-            {"attempt_id": "a1", "gate_id": "g1", "attempted_at": now, "passed": True},
-            {"attempt_id": "a2", "gate_id": "g1", "attempted_at": now + timedelta(minutes=1), "passed": False},
+            {"attempt_id": f"a{i}", "gate_id": "g1", "attempted_at": now + timedelta(seconds=7 * i), "passed": i % 2 == 0}
+            for i in range(40)
         ]
         outcomes = [
-            {"timestamp": now + timedelta(seconds=20), "success": False},
-            {"timestamp": now + timedelta(minutes=1, seconds=15), "success": True},
+            {"timestamp": (now + timedelta(seconds=5 * i)).replace(tzinfo=None), "success": i % 3 == 0}
+            for i in range(60)
         ]
 
-        rows = evaluate_attempt_outcomes(attempts, outcomes, outcome_window_seconds=30)
-        self.assertEqual(rows[0].label, "moved_too_early")
-        self.assertEqual(rows[1].label, "false_negative")
+        with mock.patch("metaspn_gates.learning._NUMPY_MIN_ATTEMPTS", 0):
+            vectorized = evaluate_attempt_outcomes(attempts, outcomes, outcome_window_seconds=20)
+            with mock.patch("metaspn_gates.learning._load_window_kernel", return_value=None):
+                searchsorted = evaluate_attempt_outcomes(attempts, outcomes, outcome_window_seconds=20)
+        with mock.patch("metaspn_gates.learning._NUMPY_MIN_ATTEMPTS", len(attempts) + 1):
+            bisected = evaluate_attempt_outcomes(attempts, outcomes, outcome_window_seconds=20)
+        self.assertEqual(vectorized, bisected)
+        self.assertEqual(searchsorted, bisected)
 
     def test_calibration_recommendation_determinism(self) -> None:
-        now = datetime(2026, 2, 6, 12, 0, tzinfo=timezone.utc)
         attempts = [
-            {"attempt_id": "a1", "gate_id": "g1", "attempted_at": now, "passed": True},
-            {"attempt_id": "a2", "gate_id": "g1", "attempted_at": now + timedelta(minutes=1), "passed": True},
-            {"attempt_id": "a3", "gate_id": "g1", "attempted_at": now + timedelta(minutes=2), "passed": False},
-            {"attempt_id": "a4", "gate_id": "g1", "attempted_at": now + timedelta(minutes=3), "passed": False},
+            {"attempt_id": "a1", "gate_id": "g1", "attempted_at": _OFFSETS[0], "passed": True},
+            {"attempt_id": "a2", "gate_id": "g1", "attempted_at": _OFFSETS[1], "passed": True},
+            {"attempt_id": "a3", "gate_id": "g1", "attempted_at": _OFFSETS[2], "passed": False},
+            {"attempt_id": "a4", "gate_id": "g1", "attempted_at": _OFFSETS[3], "passed": False},
         ]
         outcomes = [
-            {"timestamp": now + timedelta(minutes=5), "success": True},
-            {"timestamp": now + timedelta(minutes=6), "success": True},
+            {"timestamp": _OFFSETS[4], "success": True},
+            {"timestamp": _OFFSETS[5], "success": True},
         ]
 
         rows = evaluate_attempt_outcomes(attempts, outcomes, outcome_window_seconds=120)
         p1 = generate_calibration_proposals(rows, min_samples=3)
         p2 = generate_calibration_proposals(rows, min_samples=3)
 
-        self.assertEqual([(x.gate_id, x.recommendation_type, x.direction, x.confidence) for x in p1], [(x.gate_id, x.recommendation_type, x.direction, x.confidence) for x in p2])
-        self.assertTrue(all(not p.auto_apply for p in p1))
+        self.assertEqual(p1, p2)
+        self.assertFalse(any(p.auto_apply for p in p1))
 
     def test_classify_failure_reason_defaults(self) -> None:
         self.assertIsNone(classify_failure_reason(label="true_positive", taxonomy_map={}))